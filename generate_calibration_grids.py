@@ -27,6 +27,10 @@ def generate_polar_view():
 
     # Draw azimuth rings (great-circle distances from pole) to match polar reference
     calibration_azimuths = [15, 30, 45, 60, 75, 90]  # Great-circle angles from pole
+    longitudes = list(range(-180, 180, 30))  # Longitude lines - every 30 degrees
+
+    # Project all rings and longitudes with a single batched call; the draw calls below reuse the points
+    project_grid_polar(calibration_azimuths, longitudes, 0, ring_points=200, longitude_points=144)
 
     for azimuth in calibration_azimuths:
         color = RED if azimuth == 45 else GRAY  # Highlight 45° ring
@@ -43,8 +47,8 @@ def generate_polar_view():
         text_rect.center = (label_x, center_y)
         screen.blit(text, text_rect)
 
-    # Draw longitude lines - every 30 degrees
-    for lon in range(-180, 180, 30):
+    # Draw longitude lines
+    for lon in longitudes:
         color = GREEN if lon == 0 else GRAY
         draw_longitude_line_polar(screen, lon, color, 0, num_points=144)
 
@@ -30,15 +30,10 @@ while running:
     ax.plot(x, y)
     fig.canvas.draw()
 
-    # Get RGBA bytes from the Agg canvas
-    buf = np.frombuffer(fig.canvas.tostring_argb(), dtype=np.uint8)
-    buf = buf.reshape(H, W, 4)  # match your fig size to W,H for speed
-
-    # Convert ARGB -> RGB for pygame (drop alpha)
-    rgb = buf[:, :, 1:4]  # skip A; now R,G,B
-
-    # Create Surface from array (copy=False can be tricky; copy is safer)
-    surf = pygame.surfarray.make_surface(np.transpose(rgb, (1,0,2)))  # pygame expects (W,H,3)
+    # Wrap the Agg canvas RGBA buffer (row-major H x W x 4) directly as a Surface
+    # No ARGB reslicing or (W,H,3) transpose copy; match your fig size to W,H for this to work
+    buf = fig.canvas.buffer_rgba()
+    surf = pygame.image.frombuffer(buf, (W, H), 'RGBA')
     screen.blit(surf, (0,0))
     pygame.display.flip()
 
@@ -11,6 +11,10 @@ H, W = 480, 640
 SCALE_X = 0.80  # Even more expansion (was 0.85)
 SCALE_Y = 0.78  # Even more expansion (was 0.83)
 
+# Caches for ring/longitude polylines, keyed by (kind, angle_deg, num_points)
+_template_cache = {}  # unrotated cartesian samples (x, y, z)
+_ring_cache = {}      # projected (N, 2) screen points at rotation_offset=0
+
 def azimuthal_equidistant_projection(x, y, z):
     """Clean Azimuthal Equidistant projection from 3D cartesian coordinates to screen"""
     # Skip points behind the hemisphere (x <= 0 for forward-facing view)
@@ -47,102 +51,160 @@ def azimuthal_equidistant_projection(x, y, z):
         return screen_x, screen_y
     return None, None
 
-def draw_azimuth_ring_polar(surface, azimuth_deg, color, rotation_offset=0, num_points=200):
-    """Draw a ring at constant great-circle distance from pole (azimuth ring)"""
-    points = []
-    theta = np.radians(azimuth_deg)  # great-circle angle from pole
-
-    for i in range(num_points + 1):
-        phi = 2 * np.pi * i / num_points - np.pi + rotation_offset  # azimuth around pole
+def aep_batch(x, y, z):
+    """Vectorized azimuthal_equidistant_projection over arrays of cartesian points
 
-        # Convert to cartesian (pole toward viewer at z=1)
-        x = np.sin(theta) * np.cos(phi)
-        y = np.sin(theta) * np.sin(phi)
-        z = np.cos(theta)
+    Returns (screen_x, screen_y, valid) where screen_x/screen_y are int32 arrays
+    and valid masks the points that land on the visible hemisphere and screen
+    """
+    x, y, z = np.broadcast_arrays(x, y, z)
 
-        screen_x, screen_y = azimuthal_equidistant_projection(z, x, y)  # pole toward viewer (z forward)
-        if screen_x is not None and screen_y is not None:
-            points.append((screen_x, screen_y))
+    # Great-circle distance from the forward direction (1, 0, 0)
+    great_circle_angle = np.arccos(np.clip(x, -1, 1))
+    max_angle = math.pi / 2
 
-    # Draw entire polyline in ONE pygame call
+    # Radial distance is linear in great-circle angle
+    radius = great_circle_angle / max_angle
+    max_screen_radius = min(W, H) / 2 * 0.9
+    screen_radius = radius * max_screen_radius
+    azimuth = np.arctan2(z, y)
+
+    exact_x = W/2 + screen_radius * np.cos(azimuth) / SCALE_X
+    exact_y = H/2 - screen_radius * np.sin(azimuth) / SCALE_Y  # flip y
+    screen_x = exact_x.astype(np.int32)
+    screen_y = exact_y.astype(np.int32)
+
+    valid = ((x > 0) & (great_circle_angle <= max_angle) &
+             (screen_x >= 0) & (screen_x < W) & (screen_y >= 0) & (screen_y < H))
+
+    # NumPy's vectorized arccos/arctan2/cos/sin can differ from math's by an ulp, which only
+    # changes the truncated pixel where a coordinate lands on an integer: redo those few
+    # samples with the scalar projection so both functions agree exactly
+    on_edge = (x > 0) & ((np.abs(exact_x - np.round(exact_x)) < 1e-6) |
+                         (np.abs(exact_y - np.round(exact_y)) < 1e-6))
+    for i in zip(*np.nonzero(on_edge)):
+        edge_x, edge_y = azimuthal_equidistant_projection(float(x[i]), float(y[i]), float(z[i]))
+        valid[i] = edge_x is not None
+        if edge_x is not None:
+            screen_x[i], screen_y[i] = edge_x, edge_y
+
+    return screen_x, screen_y, valid
+
+def line_template(kind, angle_deg, num_points):
+    """Get cartesian samples of a ring or meridian at zero rotation, using cache if available"""
+    key = (kind, angle_deg, num_points)
+
+    if key not in _template_cache:
+        i = np.arange(num_points + 1)
+        if kind in ('azimuth_polar', 'latitude_standard'):
+            # Constant polar angle, azimuth sweeps from -π to π
+            theta = np.radians(angle_deg if kind == 'azimuth_polar' else 90 - angle_deg)
+            phi = 2 * np.pi * i / num_points - np.pi
+        else:
+            # Constant longitude, latitude sweeps from 90 to -90
+            phi = np.radians(angle_deg)
+            lat_deg = 90 - 180 * i / num_points
+            theta = np.radians(90 - lat_deg)
+        theta, phi = np.broadcast_arrays(theta, phi)
+
+        _template_cache[key] = (np.sin(theta) * np.cos(phi),
+                                np.sin(theta) * np.sin(phi),
+                                np.cos(theta))
+
+    return _template_cache[key]
+
+def rotate_about_pole(x, y, rotation_offset):
+    """Rotate cartesian samples about the pole (z) axis, i.e. add rotation_offset to phi"""
+    if rotation_offset == 0:
+        return x, y
+    c, s = math.cos(rotation_offset), math.sin(rotation_offset)
+    return x * c - y * s, x * s + y * c
+
+def _projected_line(kind, angle_deg, rotation_offset, num_points):
+    """Get visible screen points (N, 2) of a ring or meridian, using cache if available"""
+    key = (kind, angle_deg, num_points)
+    if rotation_offset == 0 and key in _ring_cache:
+        return _ring_cache[key]
+
+    x, y, z = line_template(kind, angle_deg, num_points)
+    x, y = rotate_about_pole(x, y, rotation_offset)
+
+    if kind.endswith('_polar'):
+        # Pole toward viewer (z forward)
+        screen_x, screen_y, valid = aep_batch(z, x, y)
+    else:
+        # Standard view: pole (z) goes to top, equator plane becomes forward-facing
+        # (-y toward viewer, x right, z up)
+        screen_x, screen_y, valid = aep_batch(-y, x, z)
+    points = np.column_stack((screen_x[valid], screen_y[valid]))
+
+    if rotation_offset == 0:
+        _ring_cache[key] = points
+    return points
+
+def _draw_polyline(surface, color, points):
+    """Draw entire polyline in ONE pygame call"""
     if len(points) > 1:
         import pygame
-        pygame.draw.lines(surface, color, False, points, 1)
+        # pygame reads a list of pairs faster than an ndarray
+        pygame.draw.lines(surface, color, False, points.tolist(), 1)
+
+def draw_azimuth_ring_polar(surface, azimuth_deg, color, rotation_offset=0, num_points=200):
+    """Draw a ring at constant great-circle distance from pole (azimuth ring)"""
+    points = _projected_line('azimuth_polar', azimuth_deg, rotation_offset, num_points)
+    _draw_polyline(surface, color, points)
 
 def draw_longitude_line_polar(surface, lon_deg, color, rotation_offset=0, num_points=144):
     """Draw a line of constant longitude for polar view (pole at center)"""
-    points = []
-    phi = np.radians(lon_deg) + rotation_offset
-
-    for i in range(num_points + 1):
-        lat_deg = 90 - 180 * i / num_points  # latitude from 90 to -90
-        theta = np.radians(90 - lat_deg)     # polar angle
-
-        # Convert to cartesian (no rotation - pole toward viewer)
-        x = np.sin(theta) * np.cos(phi)
-        y = np.sin(theta) * np.sin(phi)
-        z = np.cos(theta)
-
-        screen_x, screen_y = azimuthal_equidistant_projection(z, x, y)  # pole toward viewer (z forward)
-        if screen_x is not None and screen_y is not None:
-            points.append((screen_x, screen_y))
-
-    # Draw entire polyline in ONE pygame call
-    if len(points) > 1:
-        import pygame
-        pygame.draw.lines(surface, color, False, points, 1)
+    points = _projected_line('longitude_polar', lon_deg, rotation_offset, num_points)
+    _draw_polyline(surface, color, points)
 
 def draw_latitude_line_standard(surface, lat_deg, color, rotation_offset=0, num_points=200):
     """Draw a line of constant latitude for standard view (pole at top)"""
-    points = []
-    theta = np.radians(90 - lat_deg)  # convert latitude to polar angle
-
-    for i in range(num_points + 1):
-        phi = 2 * np.pi * i / num_points - np.pi + rotation_offset  # azimuth from -π to π
-
-        # Convert to cartesian then rotate for standard view
-        x = np.sin(theta) * np.cos(phi)
-        y = np.sin(theta) * np.sin(phi)
-        z = np.cos(theta)
-
-        # Rotate for standard view: pole (z) goes to top (y), equator plane becomes forward-facing
-        rotated_x = -y  # toward viewer
-        rotated_y = x   # right
-        rotated_z = z   # up (pole at top)
-
-        screen_x, screen_y = azimuthal_equidistant_projection(rotated_x, rotated_y, rotated_z)
-        if screen_x is not None and screen_y is not None:
-            points.append((screen_x, screen_y))
-
-    # Draw entire polyline in ONE pygame call
-    if len(points) > 1:
-        import pygame
-        pygame.draw.lines(surface, color, False, points, 1)
+    points = _projected_line('latitude_standard', lat_deg, rotation_offset, num_points)
+    _draw_polyline(surface, color, points)
 
 def draw_longitude_line_standard(surface, lon_deg, color, rotation_offset=0, num_points=144):
     """Draw a line of constant longitude for standard view (pole at top)"""
-    points = []
-    phi = np.radians(lon_deg) + rotation_offset
-
-    for i in range(num_points + 1):
-        lat_deg = 90 - 180 * i / num_points  # latitude from 90 to -90
-        theta = np.radians(90 - lat_deg)     # polar angle
-
-        # Convert to cartesian then rotate for standard view
-        x = np.sin(theta) * np.cos(phi)
-        y = np.sin(theta) * np.sin(phi)
-        z = np.cos(theta)
-
-        # Rotate for standard view: pole (z) goes to top (y), equator plane becomes forward-facing
-        rotated_x = -y  # toward viewer
-        rotated_y = x   # right
-        rotated_z = z   # up (pole at top)
-
-        screen_x, screen_y = azimuthal_equidistant_projection(rotated_x, rotated_y, rotated_z)
-        if screen_x is not None and screen_y is not None:
-            points.append((screen_x, screen_y))
-
-    # Draw entire polyline in ONE pygame call
-    if len(points) > 1:
-        import pygame
-        pygame.draw.lines(surface, color, False, points, 1)
+    points = _projected_line('longitude_standard', lon_deg, rotation_offset, num_points)
+    _draw_polyline(surface, color, points)
+
+def project_grid_polar(azimuths, longitudes, rotation_offset=0, ring_points=200, longitude_points=144):
+    """Project azimuth rings and longitude lines for polar view with one batched projection
+
+    Returns visible screen points (N, 2) per line: all azimuth rings first, then all
+    longitudes. At zero rotation the results also fill the per-line cache, so the
+    draw_*_polar functions reuse them
+    """
+    keys = ([('azimuth_polar', azimuth_deg, ring_points) for azimuth_deg in azimuths] +
+            [('longitude_polar', lon_deg, longitude_points) for lon_deg in longitudes])
+
+    if rotation_offset == 0 and all(key in _ring_cache for key in keys):
+        lines = [_ring_cache[key] for key in keys]
+    else:
+        # Concatenate every line's samples and project them in a single call
+        templates = [line_template(*key) for key in keys]
+        x, y, z = (np.concatenate(parts) for parts in zip(*templates))
+        x, y = rotate_about_pole(x, y, rotation_offset)
+        screen_x, screen_y, valid = aep_batch(z, x, y)  # pole toward viewer (z forward)
+
+        # Split back into per-line point arrays at the known boundaries
+        bounds = np.cumsum([len(template[0]) for template in templates])[:-1]
+        lines = [np.column_stack((line_x[line_valid], line_y[line_valid]))
+                 for line_x, line_y, line_valid in zip(np.split(screen_x, bounds),
+                                                       np.split(screen_y, bounds),
+                                                       np.split(valid, bounds))]
+        if rotation_offset == 0:
+            _ring_cache.update(zip(keys, lines))
+
+    return lines
+
+def draw_grid_polar(surface, azimuths, longitudes, colors, rotation_offset=0,
+                    ring_points=200, longitude_points=144):
+    """Draw azimuth rings and longitude lines for polar view with one batched projection
+
+    colors holds one color per line: all azimuth rings first, then all longitudes
+    """
+    lines = project_grid_polar(azimuths, longitudes, rotation_offset, ring_points, longitude_points)
+    for color, points in zip(colors, lines):
+        _draw_polyline(surface, color, points)
@@ -3,7 +3,6 @@ os.environ["SDL_VIDEODRIVER"] = "kmsdrm"
 
 import pygame
 import numpy as np
-import math
 
 # Init display
 pygame.init()
@@ -13,30 +12,33 @@ W, H = screen.get_size()
 running = True
 clock = pygame.time.Clock()
 frame = 0
+font = pygame.font.Font(None, 36)  # Load once; font construction is expensive per frame
+
+# Sine wave sample positions, every 4 pixels for performance
+wave_xs = np.arange(0, W, 4)
+wave_points = np.empty((len(wave_xs), 2), dtype=np.int32)
+wave_points[:, 0] = wave_xs
+
+# Constant phase offsets of the 5 moving circles
+CIRCLE_PHASE = np.arange(5) * 2 * np.pi / 5
 
 while running:
     # Clear screen
     screen.fill((0, 0, 0))
 
-    # Draw animated sine wave directly with pygame
-    points = []
-    for x in range(0, W, 4):  # Every 4 pixels for performance
-        # Animated sine wave
-        y = H//2 + int(100 * math.sin(x * 0.02 + frame * 0.1))
-        points.append((x, y))
+    # Draw animated sine wave directly with pygame (all samples in one vectorized pass)
+    wave_points[:, 1] = H//2 + (100 * np.sin(wave_xs * 0.02 + frame * 0.1)).astype(np.int32)
 
-    # Draw the wave
-    if len(points) > 1:
-        pygame.draw.lines(screen, (0, 255, 0), False, points, 2)
+    # Draw the wave (plain lists are much faster for pygame to read than ndarrays)
+    pygame.draw.lines(screen, (0, 255, 0), False, wave_points.tolist(), 2)
 
-    # Draw some moving circles
+    # Draw some moving circles (positions for all circles in one vectorized pass)
+    circle_xs = (W//2 + 200 * np.cos(frame * 0.05 + CIRCLE_PHASE)).astype(int).tolist()
+    circle_ys = (H//2 + 100 * np.sin(frame * 0.07 + CIRCLE_PHASE)).astype(int).tolist()
     for i in range(5):
-        x = int(W//2 + 200 * math.cos(frame * 0.05 + i * 2 * math.pi / 5))
-        y = int(H//2 + 100 * math.sin(frame * 0.07 + i * 2 * math.pi / 5))
-        pygame.draw.circle(screen, (255, i*50, 255-i*50), (x, y), 20)
+        pygame.draw.circle(screen, (255, i*50, 255-i*50), (circle_xs[i], circle_ys[i]), 20)
 
     # Draw frame counter
-    font = pygame.font.Font(None, 36)
     text = font.render(f"Frame: {frame}", True, (255, 255, 255))
     screen.blit(text, (10, 10))
 
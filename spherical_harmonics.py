@@ -10,28 +10,48 @@ import os
 import math
 from scipy.special import sph_harm
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; values_to_colors falls back to NumPy
+    njit = None
+
 # Screen dimensions (from your setup)
 H, W = 720, 1280
 
 # Global cache for coordinate grids
 _coord_cache = {}
 
+# Global cache for per-(l, m) harmonic basis on a coordinate grid
+_harmonic_cache = {}
+
+# Low-res render surface and full-res output surface, keyed by low-res size
+_surface_cache = {}
+
+# Color and scratch buffers reused across frames, keyed by value array shape
+_color_buffers = {}
+
 def get_coordinate_grids_cached(H_res, W_res):
-    """Get coordinate grids, using cache if available"""
+    """Get coordinate grids, using cache if available
+
+    Grids are laid out (W_res, H_res) to match pygame surfarrays, so colors
+    computed from them can be written to a surface without a transpose.
+    """
     cache_key = (H_res, W_res)
 
     if cache_key not in _coord_cache:
-        # Create coordinate grid
-        y_coords, x_coords = np.mgrid[0:H_res, 0:W_res]
+        # Create coordinate column/row vectors; they broadcast to (W_res, H_res) on use
+        x_coords = np.arange(W_res)[:, None]
+        y_coords = np.arange(H_res)[None, :]
 
         # Convert screen coordinates to normalized coordinates [-1, 1]
         # Scale from low-res to 640x480 coordinate system (reverse of wireframe scaling)
-        norm_x = (x_coords * 640 / W_res - 320) / 320
-        norm_y = (y_coords * 480 / H_res - 240) / 240
+        # float32 halves the bytes per element; the output is only uint8 colors
+        norm_x = ((x_coords * 640 / W_res - 320) / 320).astype(np.float32)
+        norm_y = ((y_coords * 480 / H_res - 240) / 240).astype(np.float32)
 
         # Convert to spherical coordinates using inverse azimuthal equidistant projection
         # Calculate radius from center
-        radius = np.sqrt(norm_x**2 + norm_y**2)
+        radius = np.hypot(norm_x, norm_y)
 
         # In azimuthal equidistant, radius is proportional to great-circle angle
         # Max radius corresponds to π/2 (hemisphere edge)
@@ -47,7 +67,8 @@ def get_coordinate_grids_cached(H_res, W_res):
         _coord_cache[cache_key] = {
             'great_circle_angle': great_circle_angle,
             'azimuth': azimuth,
-            'valid_mask': valid_mask
+            'valid_mask': valid_mask,
+            'valid_idx': np.flatnonzero(valid_mask)  # flat indices of hemisphere pixels
         }
 
     return _coord_cache[cache_key]
@@ -67,40 +88,136 @@ def spherical_harmonics(l, m, theta, phi):
     # scipy.special.sph_harm uses (m, l, phi, theta) order
     return sph_harm(m, l, phi, theta)
 
+def get_harmonic_basis_cached(l, m, H_res, W_res):
+    """Get Y_l^m on a grid at zero rotation, using cache if available
 
-def values_to_colors(values, min_val=-1, max_val=1):
-    """Convert spherical harmonic values to RGB colors using numpy
+    Rotating the view by d_phi multiplies Y_l^m by e^{i m d_phi}, so the
+    unrotated real/imaginary parts are all that is needed to draw any frame.
+    Values are stored compacted to the valid hemisphere pixels (coords['valid_idx']),
+    along with a full-grid 'Y_real' buffer that stays zero outside the hemisphere.
+    """
+    cache_key = (l, m, H_res, W_res)
 
-    Args:
-        values: numpy array of real values (should be normalized to [-1, 1])
-        min_val: Minimum value (-1)
-        max_val: Maximum value (+1)
+    if cache_key not in _harmonic_cache:
+        coords = get_coordinate_grids_cached(H_res, W_res)
+        valid_idx = coords['valid_idx']
+        theta_valid = coords['great_circle_angle'].ravel()[valid_idx]
+        phi_valid = coords['azimuth'].ravel()[valid_idx]
 
-    Returns:
-        RGB array with shape (..., 3) where each component is 0-255
+        Y0_valid = spherical_harmonics(l, m, theta_valid, phi_valid)
+
+        _harmonic_cache[cache_key] = {
+            'Y0_re_valid': np.real(Y0_valid).astype(np.float32),
+            'Y0_im_valid': np.imag(Y0_valid).astype(np.float32),
+            'Y_real': np.zeros(coords['valid_mask'].shape, dtype=np.float32)
+        }
+
+    return _harmonic_cache[cache_key]
+
+def get_surfaces_cached(H_res, W_res):
+    """Get persistent (low-res, full-res) surfaces, creating them on first use
+
+    Both surfaces share the display's pixel format when it is 24/32-bit (as
+    pixels3d requires), so scaling and the final blit to the screen take the
+    fast same-format paths instead of converting pixels every frame.
     """
-    # Normalize to [0, 1]
-    normalized = (values - min_val) / (max_val - min_val)
-    normalized = np.clip(normalized, 0, 1)
+    cache_key = (H_res, W_res)
+
+    if cache_key not in _surface_cache:
+        display = pygame.display.get_surface()
+        if display is not None and display.get_bitsize() in (24, 32):
+            _surface_cache[cache_key] = (pygame.Surface((W_res, H_res), 0, display),
+                                         pygame.Surface((W, H), 0, display))
+        else:
+            _surface_cache[cache_key] = (pygame.Surface((W_res, H_res)), pygame.Surface((W, H)))
+
+    return _surface_cache[cache_key]
 
-    # Initialize RGB arrays
-    colors = np.zeros(normalized.shape + (3,), dtype=np.uint8)
+def _build_colormap_lut(levels=256):
+    """Sample the blue-white-red colormap at evenly spaced normalized values in [0, 1]"""
+    normalized = np.linspace(0, 1, levels)
+    lut = np.zeros((levels, 3), dtype=np.uint8)
 
-    # Blue to white to red colormap
     # For normalized < 0.5: Blue to white
     mask1 = normalized < 0.5
     t1 = normalized[mask1] * 2  # 0 to 1
-    colors[mask1, 0] = (t1 * 255).astype(np.uint8)  # r
-    colors[mask1, 1] = (t1 * 255).astype(np.uint8)  # g
-    colors[mask1, 2] = 255  # b
+    lut[mask1, 0] = (t1 * 255).astype(np.uint8)  # r
+    lut[mask1, 1] = (t1 * 255).astype(np.uint8)  # g
+    lut[mask1, 2] = 255  # b
 
     # For normalized >= 0.5: White to red
     mask2 = normalized >= 0.5
     t2 = (normalized[mask2] - 0.5) * 2  # 0 to 1
-    colors[mask2, 0] = 255  # r
-    colors[mask2, 1] = ((1 - t2) * 255).astype(np.uint8)  # g
-    colors[mask2, 2] = ((1 - t2) * 255).astype(np.uint8)  # b
+    lut[mask2, 0] = 255  # r
+    lut[mask2, 1] = ((1 - t2) * 255).astype(np.uint8)  # g
+    lut[mask2, 2] = ((1 - t2) * 255).astype(np.uint8)  # b
+
+    return lut
+
+# Colormap lookup table: entry 0 is the black background outside the hemisphere,
+# entries 1.. are indexed by the quantized normalized value
+_COLORMAP_LUT = np.vstack((np.zeros((1, 3), dtype=np.uint8), _build_colormap_lut()))
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _values_to_colors_kernel(values, valid_mask, lut, min_val, scale, out):
+        """Quantize each flat value to a LUT index and write its RGB (N, 3) in one fused pass"""
+        top = lut.shape[0] - 1
+        for i in prange(values.size):
+            if valid_mask is not None and not valid_mask[i]:
+                k = 0  # background
+            else:
+                k = int((values[i] - min_val) * scale + 1.5)  # +1 skips background, +0.5 rounds
+                k = 1 if k < 1 else top if k > top else k
+            out[i, 0] = lut[k, 0]
+            out[i, 1] = lut[k, 1]
+            out[i, 2] = lut[k, 2]
+else:
+    _values_to_colors_kernel = None
+
+def get_color_buffers_cached(shape):
+    """Get reusable (colors, scaled, index) buffers for values of this shape"""
+    if shape not in _color_buffers:
+        _color_buffers[shape] = (np.empty(shape + (3,), dtype=np.uint8),
+                                 np.empty(shape, dtype=np.float32),
+                                 np.empty(shape, dtype=np.intp))
+
+    return _color_buffers[shape]
+
+def values_to_colors(values, min_val=-1, max_val=1, valid_mask=None):
+    """Convert spherical harmonic values to RGB colors using a colormap lookup table
 
+    Args:
+        values: numpy array of real values (should be normalized to [-1, 1])
+        min_val: Minimum value (-1)
+        max_val: Maximum value (+1)
+        valid_mask: Optional boolean array; pixels where it is False are black
+
+    Returns:
+        RGB array with shape (..., 3) where each component is 0-255. The array
+        is a buffer reused by the next call with the same shape
+    """
+    top = len(_COLORMAP_LUT) - 1
+    scale = (top - 1) / (max_val - min_val)  # maps [min_val, max_val] onto LUT indices 1..top
+    colors, scaled, idx = get_color_buffers_cached(values.shape)
+
+    if _values_to_colors_kernel is not None:
+        _values_to_colors_kernel(np.ascontiguousarray(values).ravel(),
+                                 None if valid_mask is None else valid_mask.ravel(),
+                                 _COLORMAP_LUT, min_val, scale, colors.reshape(-1, 3))
+        return colors
+
+    # Quantize to the nearest LUT entry in place; clipping also covers out-of-range values
+    np.subtract(values, min_val, out=scaled)
+    np.multiply(scaled, scale, out=scaled)
+    np.add(scaled, 1.5, out=scaled)  # +1 skips the background entry, +0.5 rounds
+    np.clip(scaled, 1, top, out=scaled)
+    np.copyto(idx, scaled, casting='unsafe')  # truncating cast
+    if valid_mask is not None:
+        np.multiply(idx, valid_mask, out=idx)  # invalid pixels -> background entry 0
+
+    # Indices are already in range, so mode='clip' lets take write straight into colors
+    np.take(_COLORMAP_LUT, idx, axis=0, out=colors, mode='clip')
     return colors
 
 def create_spherical_harmonics_surface(l, m, rotation_offset=0):
@@ -108,33 +225,28 @@ def create_spherical_harmonics_surface(l, m, rotation_offset=0):
     # Use lower resolution for faster computation (1/4 resolution = 16x fewer pixels)
     H_low, W_low = H // 4, W // 4  # 180x320 instead of 720x1280
 
-    # Get cached coordinate grids
+    # Get cached coordinate grids and unrotated harmonic
     coords = get_coordinate_grids_cached(H_low, W_low)
-
-    # Apply rotation to phi coordinate
-    theta = coords['great_circle_angle']  # polar angle from forward direction
-    phi = coords['azimuth'] + rotation_offset  # azimuthal angle with rotation
+    basis = get_harmonic_basis_cached(l, m, H_low, W_low)
     valid_mask = coords['valid_mask']
 
-    # Calculate spherical harmonics values only for valid points
-    Y_lm = np.zeros_like(theta, dtype=complex)
-    Y_lm[valid_mask] = spherical_harmonics(l, m, theta[valid_mask], phi[valid_mask])
+    # Real part of Y0 * e^{i m rotation_offset}, computed only at hemisphere pixels
+    c, s = np.float32(math.cos(m * rotation_offset)), np.float32(math.sin(m * rotation_offset))
+    Y_valid = basis['Y0_re_valid'] * c - basis['Y0_im_valid'] * s
+    Y_real = basis['Y_real']
+    np.put(Y_real, coords['valid_idx'], Y_valid)
 
-    # Take real part
-    Y_real = np.real(Y_lm)
+    # Convert to colors (invalid regions map to the black LUT entry)
+    colors = values_to_colors(Y_real, valid_mask=valid_mask)
 
-    # Convert to colors
-    colors = values_to_colors(Y_real)
+    # Write colors straight into the persistent low-resolution surface
+    low_surface, surface = get_surfaces_cached(H_low, W_low)
+    pixels = pygame.surfarray.pixels3d(low_surface)  # (width, height, 3) view, locks the surface
+    pixels[:] = colors  # colors are already (width, height, 3)
+    del pixels  # unlock
 
-    # Set invalid regions to black
-    colors[~valid_mask] = [0, 0, 0]
-
-    # Create low-resolution pygame surface from color array
-    low_surface = pygame.Surface((W_low, H_low))
-    pygame.surfarray.blit_array(low_surface, colors.swapaxes(0, 1))  # pygame expects (width, height, 3)
-
-    # Scale up to full resolution using pygame's transform.scale
-    surface = pygame.transform.scale(low_surface, (W, H))
+    # Scale up to full resolution into the persistent output surface
+    pygame.transform.scale(low_surface, (W, H), surface)
 
     return surface
 
@@ -185,6 +297,10 @@ def main():
 
     clock = pygame.time.Clock()
 
+    # l and m are fixed for the run, so render the parameter label once
+    font = pygame.font.Font(None, 36)
+    label_surface = font.render(f"Y_{l}^{m}", True, WHITE)
+
     # Animation variables
     rotation_speed = 0.3  # radians per second
     start_time = pygame.time.get_ticks()
@@ -213,9 +329,7 @@ def main():
         pygame.draw.line(screen, WHITE, (center_x, center_y - 20), (center_x, center_y + 20), 2)
 
         # Display current parameters
-        font = pygame.font.Font(None, 36)
-        text = font.render(f"Y_{l}^{m}", True, WHITE)
-        screen.blit(text, (10, 10))
+        screen.blit(label_surface, (10, 10))
 
         pygame.display.flip()
         clock.tick(30)
@@ -76,9 +76,44 @@ def main():
     frame_count = 0
     fps_start_time = start_time
 
+    # Info text: font and static lines are rendered once; Pupil/Blink lines every frame
+    font = pygame.font.Font(None, 24)
+    info_lines = [
+        f"Eye: {eye_color.title()}",
+        None,  # Pupil
+        None,  # Blink
+        "",
+        "Controls:",
+        "SPACE - Blink",
+        "R - Reset position",
+        "Arrows - Move eye",
+        "+/- - Pupil size",
+        "ESC/Q - Quit"
+    ]
+
+    # Static HUD drawn once: info panel (BLEND_RGBA_MAX keeps the text's own alpha on
+    # the transparent panel) and center crosshair for reference
+    info_panel = pygame.Surface((200, 20 * len(info_lines)), pygame.SRCALPHA)
+    for i, line in enumerate(info_lines):
+        if line:  # Skip empty and dynamic lines
+            info_panel.blit(font.render(line, True, WHITE), (0, 20 * i),
+                            special_flags=pygame.BLEND_RGBA_MAX)
+
+    crosshair = pygame.Surface((21, 21), pygame.SRCALPHA)
+    pygame.draw.line(crosshair, WHITE, (0, 10), (20, 10), 1)
+    pygame.draw.line(crosshair, WHITE, (10, 0), (10, 20), 1)
+    center_x, center_y = W // 2, H // 2
+
+    # Loop-invariant lookups bound once
+    get_ticks = pygame.time.get_ticks
+    get_events = pygame.event.get
+    max_eye_angle = eyeball.max_eye_angle
+    min_pupil_radius = eyeball.min_pupil_radius
+    max_pupil_radius = eyeball.max_pupil_radius
+
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in get_events():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -86,7 +121,7 @@ def main():
                     running = False
                 elif event.key == pygame.K_SPACE:
                     # Trigger immediate blink
-                    current_time_sec = pygame.time.get_ticks() / 1000.0
+                    current_time_sec = get_ticks() / 1000.0
                     eyeball.next_blink_time = current_time_sec
                     eyeball.blink_state = 0.0  # Reset to open state first
                 elif event.key == pygame.K_r:
@@ -97,78 +132,58 @@ def main():
                     eyeball.target_phi = 0.0
                 elif event.key == pygame.K_UP:
                     # Manual eye movement
-                    eyeball.target_theta = max(-eyeball.max_eye_angle,
-                                             eyeball.target_theta - 0.1)
+                    eyeball.target_theta = max(-max_eye_angle, eyeball.target_theta - 0.1)
                 elif event.key == pygame.K_DOWN:
-                    eyeball.target_theta = min(eyeball.max_eye_angle,
-                                             eyeball.target_theta + 0.1)
+                    eyeball.target_theta = min(max_eye_angle, eyeball.target_theta + 0.1)
                 elif event.key == pygame.K_LEFT:
-                    eyeball.target_phi = max(-eyeball.max_eye_angle,
-                                           eyeball.target_phi - 0.1)
+                    eyeball.target_phi = max(-max_eye_angle, eyeball.target_phi - 0.1)
                 elif event.key == pygame.K_RIGHT:
-                    eyeball.target_phi = min(eyeball.max_eye_angle,
-                                           eyeball.target_phi + 0.1)
+                    eyeball.target_phi = min(max_eye_angle, eyeball.target_phi + 0.1)
                 elif event.key == pygame.K_EQUALS or event.key == pygame.K_PLUS:
                     # Dilate pupil
-                    eyeball.pupil_radius = min(eyeball.max_pupil_radius,
-                                             eyeball.pupil_radius + 0.01)
+                    eyeball.pupil_radius = min(max_pupil_radius, eyeball.pupil_radius + 0.01)
                 elif event.key == pygame.K_MINUS:
                     # Contract pupil
-                    eyeball.pupil_radius = max(eyeball.min_pupil_radius,
-                                             eyeball.pupil_radius - 0.01)
+                    eyeball.pupil_radius = max(min_pupil_radius, eyeball.pupil_radius - 0.01)
 
         # Calculate current time
-        current_time = (pygame.time.get_ticks() - start_time) / 1000.0
-
-        # Clear screen
-        screen.fill(BLACK)
+        current_time = (get_ticks() - start_time) / 1000.0
 
-        # Create and draw eyeball surface
+        # Create eyeball surface
         eyeball_surface = eyeball.create_eyeball_surface(current_time)
-        screen.blit(eyeball_surface, (0, 0))
-
-        # Draw center crosshair for reference
-        center_x, center_y = W // 2, H // 2
-        pygame.draw.line(screen, WHITE, (center_x - 10, center_y), (center_x + 10, center_y), 1)
-        pygame.draw.line(screen, WHITE, (center_x, center_y - 10), (center_x, center_y + 10), 1)
-
-        # Display info
-        font = pygame.font.Font(None, 24)
-
-        # Eye color and controls
-        info_lines = [
-            f"Eye: {eye_color.title()}",
-            f"Pupil: {eyeball.pupil_radius:.2f}",
-            f"Blink: {eyeball.blink_state:.2f}",
-            "",
-            "Controls:",
-            "SPACE - Blink",
-            "R - Reset position",
-            "Arrows - Move eye",
-            "+/- - Pupil size",
-            "ESC/Q - Quit"
-        ]
-
-        y_offset = 10
-        for line in info_lines:
-            if line:  # Skip empty lines
-                text = font.render(line, True, WHITE)
-                screen.blit(text, (10, y_offset))
-            y_offset += 20
 
         # FPS counter
         frame_count += 1
-        if frame_count % 30 == 0:  # Update every 30 frames
-            elapsed = (pygame.time.get_ticks() - fps_start_time) / 1000.0
+        show_fps = frame_count % 30 == 0  # Update every 30 frames
+        if show_fps:
+            elapsed = (get_ticks() - fps_start_time) / 1000.0
             fps = frame_count / elapsed
             if elapsed > 1.0:  # Reset counter periodically
                 frame_count = 0
-                fps_start_time = pygame.time.get_ticks()
-
-            fps_text = font.render(f"FPS: {fps:.1f}", True, WHITE)
-            screen.blit(fps_text, (W - 80, 10))
+                fps_start_time = get_ticks()
+
+        # Redraw and flip only when the eye or the overlay text changed
+        if eyeball.frame_changed or show_fps:
+            # Clear screen
+            screen.fill(BLACK)
+
+            # Draw eyeball, HUD and the changing info lines in one batched blit
+            pupil_text = font.render(f"Pupil: {eyeball.pupil_radius:.2f}", True, WHITE)
+            blink_text = font.render(f"Blink: {eyeball.blink_state:.2f}", True, WHITE)
+            screen.blits([
+                (eyeball_surface, (0, 0)),
+                (crosshair, (center_x - 10, center_y - 10)),
+                (info_panel, (10, 10)),
+                (pupil_text, (10, 30)),
+                (blink_text, (10, 50))
+            ])
+
+            if show_fps:
+                fps_text = font.render(f"FPS: {fps:.1f}", True, WHITE)
+                screen.blit(fps_text, (W - 80, 10))
+
+            pygame.display.flip()
 
-        pygame.display.flip()
         clock.tick(30)
 
     pygame.quit()
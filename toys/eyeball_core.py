@@ -13,6 +13,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from projection_utils import azimuthal_equidistant_projection
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; EyeballRenderer falls back to NumPy
+    njit = None
+
 # Screen dimensions (from your setup)
 H, W = 720, 1280
 
@@ -24,7 +29,7 @@ def get_coordinate_grids_cached(H_res, W_res):
     cache_key = (H_res, W_res)
 
     if cache_key not in _coord_cache:
-        # Create coordinate grid
+        # Create coordinate grid (row-major, matching the frame buffer)
         y_coords, x_coords = np.mgrid[0:H_res, 0:W_res]
 
         # Convert screen coordinates to normalized coordinates [-1, 1]
@@ -41,39 +46,133 @@ def get_coordinate_grids_cached(H_res, W_res):
         max_radius = 0.9  # Match the projection_utils.py margin
         great_circle_angle = radius * (np.pi / 2) / max_radius
 
-        # Calculate azimuth angle
-        azimuth = np.arctan2(norm_y, norm_x)
-
         # Mask for valid hemisphere points
         valid_mask = (radius <= max_radius) & (great_circle_angle <= np.pi/2)
 
-        # Pre-compute eyelid masks for different blink states
-        eyelid_masks = {}
-        blink_steps = 20  # Number of pre-computed blink positions
-        for i in range(blink_steps + 1):
-            blink_state = i / blink_steps  # 0.0 to 1.0
-            if blink_state > 0.0:
-                blink_threshold = 0.6 * (1 - blink_state)
-                eyelid_mask = valid_mask & (
-                    (norm_y > blink_threshold) | (norm_y < -blink_threshold)
-                )
-                eyelid_masks[blink_state] = eyelid_mask
-
+        # The grid is separable, so per-frame code reads one exact float64 value per
+        # column and per row instead of full (H, W) grids
         _coord_cache[cache_key] = {
-            'great_circle_angle': great_circle_angle,
-            'azimuth': azimuth,
             'valid_mask': valid_mask,
             'radius': radius,
-            'norm_x': norm_x,
-            'norm_y': norm_y,
-            'eyelid_masks': eyelid_masks
+            'col_x': norm_x[0, :],
+            'row_y': norm_y[:, 0]  # Increasing; eyelids cover whole rows
         }
 
     return _coord_cache[cache_key]
 
+# Global cache for shaded sclera images (static across frames)
+_sclera_cache = {}
+
+def get_sclera_template_cached(H_res, W_res, sclera_color):
+    """Get the sclera image with its radial gradient baked in, using cache if available"""
+    cache_key = (H_res, W_res, tuple(sclera_color))
+
+    if cache_key not in _sclera_cache:
+        coords = get_coordinate_grids_cached(H_res, W_res)
+        valid_mask = coords['valid_mask']
+
+        # Subtle radial gradient for realism: slight darkening at edges
+        radius_norm = coords['radius'][valid_mask] / 0.9  # Normalize to max radius
+        brightness_factor = 1.0 - 0.1 * radius_norm**2
+
+        template = np.zeros((H_res, W_res, 3), dtype=np.uint8)
+        for i in range(3):  # RGB channels
+            template[valid_mask, i] = np.clip(
+                sclera_color[i] * brightness_factor, 0, 255
+            ).astype(np.uint8)
+
+        _sclera_cache[cache_key] = template
+
+    return _sclera_cache[cache_key]
+
+# Global cache for iris textures (distance and pattern around a pixel-centered iris)
+_iris_texture_cache = {}
+
+def get_iris_texture_cached(H_res, W_res, iris_radius):
+    """Get the iris distance field and radial/angular pattern, using cache if available"""
+    cache_key = (H_res, W_res, iris_radius)
+
+    if cache_key not in _iris_texture_cache:
+        # Iris half-extent in pixels (normalized coordinates step 2/W_res and 2/H_res)
+        half_w = int(math.ceil(iris_radius * W_res / 2))
+        half_h = int(math.ceil(iris_radius * H_res / 2))
+        dx = (np.arange(-half_w, half_w + 1) * 2 / W_res)[None, :]
+        dy = (np.arange(-half_h, half_h + 1) * 2 / H_res)[:, None]
+
+        # Distance from iris center, in (H, W) order like the coordinate grids
+        distance = np.sqrt(dx**2 + dy**2)
+
+        # Radial pattern and angular pattern (iris striations)
+        radial_pattern = np.sin(distance / iris_radius * 8 * np.pi) * 0.3 + 0.7
+        angular_pattern = np.sin(np.arctan2(dy, dx) * 12) * 0.2 + 0.8
+
+        _iris_texture_cache[cache_key] = {
+            'half_w': half_w,
+            'half_h': half_h,
+            'distance': distance,
+            'iris_mask': distance <= iris_radius,
+            'pattern': radial_pattern * angular_pattern
+        }
+
+    return _iris_texture_cache[cache_key]
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True, error_model='numpy')
+    def _render_eye(colors, col_x, row_y, valid_mask, sclera_template, iris_center_x,
+                    iris_center_y, iris_radius, pupil_radius, iris_base_color, iris_dark_color,
+                    pupil_color, eyelid_color, top_rows, bottom_rows):
+        """Render sclera, iris, pupil and eyelids into the hemisphere pixels of colors in one fused pass"""
+        H_res, W_res = valid_mask.shape
+        for y in prange(H_res):
+            dy = row_y[y] - iris_center_y
+            for x in range(W_res):
+                if not valid_mask[y, x]:
+                    # Outside the hemisphere stays black (surfaces start zeroed, never written)
+                    continue
+
+                if y < top_rows or y >= bottom_rows:
+                    # Eyelid covers everything else
+                    for c in range(3):
+                        colors[y, x, c] = eyelid_color[c]
+                    continue
+
+                dx = col_x[x] - iris_center_x
+                distance = math.sqrt(dx * dx + dy * dy)
+
+                if distance <= pupil_radius:
+                    for c in range(3):
+                        colors[y, x, c] = pupil_color[c]
+                elif distance <= iris_radius:
+                    # Radial and angular (striation) patterns relative to iris center
+                    radial = math.sin(distance / iris_radius * 8 * math.pi) * 0.3 + 0.7
+                    angular = math.sin(math.atan2(dy, dx) * 12) * 0.2 + 0.8
+                    pattern = radial * angular
+                    # Convex blend of two uint8 colors (pattern in [0.24, 1]), so always in range
+                    for c in range(3):
+                        value = iris_base_color[c] * pattern + iris_dark_color[c] * (1 - pattern)
+                        colors[y, x, c] = np.uint8(value)
+                else:
+                    # Pre-shaded sclera
+                    for c in range(3):
+                        colors[y, x, c] = sclera_template[y, x, c]
+else:
+    _render_eye = None
+
 class EyeballRenderer:
     """Renders and animates a 3D eyeball on hemispherical display"""
 
+    # Fixed attribute set: faster attribute access in the per-frame code
+    __slots__ = (
+        'iris_radius', 'pupil_radius', 'min_pupil_radius', 'max_pupil_radius',
+        'eye_theta', 'eye_phi', 'max_eye_angle',
+        'target_theta', 'target_phi', 'movement_speed',
+        'blink_state', 'blink_speed', 'next_blink_time', 'blink_closing',
+        'sclera_color', 'iris_base_color', 'iris_dark_color', 'pupil_color', 'eyelid_color',
+        'last_movement_time', 'movement_interval',
+        '_low_surface', '_surface',
+        '_render_state', 'frame_changed', '_iris_geometry'
+    )
+
     def __init__(self):
         # Eyeball geometry parameters
         self.iris_radius = 0.45  # Iris size (relative to hemisphere) - increased by 50%
@@ -105,6 +204,17 @@ class EyeballRenderer:
         self.last_movement_time = -1.0  # Negative time to trigger immediate movement
         self.movement_interval = 0.0  # Will trigger on first update
 
+        # Persistent (low-res, full-res) surfaces, created on first render
+        self._low_surface = None
+        self._surface = None
+
+        # State the current surface was rendered with, and whether the last call re-rendered
+        self._render_state = None
+        self.frame_changed = True
+
+        # Iris geometry for the last iris pixel position (see get_iris_geometry_cached)
+        self._iris_geometry = None
+
     def update_eye_movement(self, current_time):
         """Update eye movement with realistic saccadic motion"""
         # Check if it's time for a new movement
@@ -161,106 +271,88 @@ class EyeballRenderer:
         # Use existing projection
         return azimuthal_equidistant_projection(-y, x, z)  # Rotate for front view
 
-    def render_sclera(self, coords):
-        """Render the white part of the eye"""
-        colors = np.zeros(coords['great_circle_angle'].shape + (3,), dtype=np.uint8)
-
-        # Fill valid hemisphere area with sclera color
-        valid_mask = coords['valid_mask']
-        colors[valid_mask] = self.sclera_color
-
-        # Add subtle radial gradient for realism
-        radius_norm = coords['radius'] / 0.9  # Normalize to max radius
-        brightness_factor = 1.0 - 0.1 * radius_norm**2  # Slight darkening at edges
-
-        for i in range(3):  # RGB channels
-            colors[valid_mask, i] = np.clip(
-                colors[valid_mask, i] * brightness_factor[valid_mask], 0, 255
-            ).astype(np.uint8)
+    def get_iris_geometry_cached(self, coords):
+        """Get the iris window, mask and pattern, reusing them while the iris stays on one pixel"""
+        H_res, W_res = coords['valid_mask'].shape
 
-        return colors
+        # Iris center offset based on eye movement, snapped to the nearest grid pixel
+        center_px = int(round((self.eye_phi * 0.8 + 1) * W_res / 2))
+        center_py = int(round((self.eye_theta * 0.8 + 1) * H_res / 2))
 
-    def render_iris(self, coords, colors):
-        """Render the colored iris part"""
-        great_circle_angle = coords['great_circle_angle']
-        azimuth = coords['azimuth']
-        valid_mask = coords['valid_mask']
-        norm_x = coords['norm_x']
-        norm_y = coords['norm_y']
+        cache_key = (W_res, H_res, self.iris_radius, center_px, center_py)
+        if self._iris_geometry is not None and self._iris_geometry['key'] == cache_key:
+            return self._iris_geometry
 
-        # Calculate iris center offset based on eye movement
-        iris_center_x = self.eye_phi * 0.8  # Scale eye movement to iris movement
-        iris_center_y = self.eye_theta * 0.8
+        texture = get_iris_texture_cached(H_res, W_res, self.iris_radius)
+        half_w, half_h = texture['half_w'], texture['half_h']
 
-        # Calculate distance from iris center for each pixel
-        iris_distance = np.sqrt((norm_x - iris_center_x)**2 + (norm_y - iris_center_y)**2)
+        # Part of the render grid covered by the texture, and the matching texture slice
+        x0, x1 = max(center_px - half_w, 0), min(center_px + half_w + 1, W_res)
+        y0, y1 = max(center_py - half_h, 0), min(center_py + half_h + 1, H_res)
+        window = (slice(y0, max(y1, y0)), slice(x0, max(x1, x0)))
+        texture_window = (slice(y0 - center_py + half_h, max(y1, y0) - center_py + half_h),
+                          slice(x0 - center_px + half_w, max(x1, x0) - center_px + half_w))
 
         # Create iris mask (circular region around shifted center)
-        iris_mask = valid_mask & (iris_distance <= self.iris_radius)
+        iris_mask = coords['valid_mask'][window] & texture['iris_mask'][texture_window]
+
+        self._iris_geometry = {
+            'key': cache_key,
+            'window': window,
+            'iris_mask': iris_mask,
+            'iris_distance': texture['distance'][texture_window][iris_mask],
+            'iris_pattern': texture['pattern'][texture_window][iris_mask]
+        }
 
-        if not np.any(iris_mask):
-            return colors
+        return self._iris_geometry
 
-        # Radial pattern for iris texture (relative to iris center)
-        iris_radius_norm = iris_distance[iris_mask] / self.iris_radius
+    def render_iris_and_pupil(self, coords, colors):
+        """Render the colored iris and the black pupil in a single scatter"""
+        geometry = self.get_iris_geometry_cached(coords)
 
-        # Create radial pattern
-        radial_pattern = np.sin(iris_radius_norm * 8 * np.pi) * 0.3 + 0.7
+        if not geometry['iris_pattern'].size:
+            return colors
 
-        # Create angular pattern (iris striations) relative to iris center
-        iris_azimuth = np.arctan2(norm_y[iris_mask] - iris_center_y, norm_x[iris_mask] - iris_center_x)
-        angular_pattern = np.sin(iris_azimuth * 12) * 0.2 + 0.8
+        # Blend iris colors as one (N, 3) array; the blend of two uint8 colors
+        # stays in [0, 255] so no clip is needed
+        base_color = np.asarray(self.iris_base_color, dtype=np.float64)
+        dark_color = np.asarray(self.iris_dark_color, dtype=np.float64)
+        pattern = geometry['iris_pattern'][:, None]
+        iris_color = (base_color * pattern + dark_color * (1 - pattern)).astype(np.uint8)
 
-        # Combine patterns
-        combined_pattern = radial_pattern * angular_pattern
+        # Pupil shares the iris center and never extends past it
+        iris_color[geometry['iris_distance'] <= self.pupil_radius] = self.pupil_color
 
-        # Apply iris colors
-        for i in range(3):
-            base_color = self.iris_base_color[i]
-            dark_color = self.iris_dark_color[i]
-            iris_color = base_color * combined_pattern + dark_color * (1 - combined_pattern)
-            colors[iris_mask, i] = np.clip(iris_color, 0, 255).astype(np.uint8)
+        colors[geometry['window']][geometry['iris_mask']] = iris_color
 
         return colors
 
-    def render_pupil(self, coords, colors):
-        """Render the black pupil"""
-        valid_mask = coords['valid_mask']
-        norm_x = coords['norm_x']
-        norm_y = coords['norm_y']
-
-        # Calculate pupil center offset (same as iris)
-        pupil_center_x = self.eye_phi * 0.8
-        pupil_center_y = self.eye_theta * 0.8
-
-        # Calculate distance from pupil center for each pixel
-        pupil_distance = np.sqrt((norm_x - pupil_center_x)**2 + (norm_y - pupil_center_y)**2)
+    def get_eyelid_rows(self, coords):
+        """Get the (top, bottom) row bounds of the open eye; eyelids cover rows outside them"""
+        row_y = coords['row_y']
+        if self.blink_state <= 0.0:
+            return 0, len(row_y)
 
-        # Create pupil mask
-        pupil_mask = valid_mask & (pupil_distance <= self.pupil_radius)
+        # Find closest of the discrete blink states
+        blink_steps = 20
+        blink_index = round(self.blink_state * blink_steps) / blink_steps
+        if blink_index <= 0.0:
+            return 0, len(row_y)
 
-        if np.any(pupil_mask):
-            colors[pupil_mask] = self.pupil_color
+        # Eyelids cover the rows above -threshold and below +threshold
+        blink_threshold = 0.6 * (1 - blink_index)
+        top_rows = int(np.searchsorted(row_y, -blink_threshold, side='left'))
+        bottom_rows = int(np.searchsorted(row_y, blink_threshold, side='right'))
 
-        return colors
+        return top_rows, bottom_rows
 
     def apply_blink_effect(self, coords, colors):
         """Apply eyelid closing effect"""
-        if self.blink_state <= 0.0:
-            return colors
+        top_rows, bottom_rows = self.get_eyelid_rows(coords)
 
-        norm_y = coords['norm_y']
         valid_mask = coords['valid_mask']
-
-        # Find closest precomputed blink state
-        blink_steps = 20
-        blink_index = round(self.blink_state * blink_steps) / blink_steps
-
-        # Use precomputed eyelid mask
-        eyelid_masks = coords['eyelid_masks']
-        if blink_index in eyelid_masks:
-            eyelid_mask = eyelid_masks[blink_index]
-            colors[eyelid_mask] = self.eyelid_color
+        colors[:top_rows][valid_mask[:top_rows]] = self.eyelid_color
+        colors[bottom_rows:][valid_mask[bottom_rows:]] = self.eyelid_color
 
         return colors
 
@@ -273,29 +365,54 @@ class EyeballRenderer:
         self.update_eye_movement(current_time)
         self.update_blinking(current_time)
 
+        # Reuse the last frame while nothing visible has changed (eye holding still between saccades)
+        render_state = (round(self.eye_theta, 3), round(self.eye_phi, 3), round(self.pupil_radius, 3),
+                        round(self.blink_state, 2), self.iris_radius, self.sclera_color, self.iris_base_color,
+                        self.iris_dark_color, self.pupil_color, self.eyelid_color)
+        self.frame_changed = render_state != self._render_state
+        if not self.frame_changed:
+            return self._surface
+        self._render_state = render_state
+
         # Get cached coordinate grids
         coords = get_coordinate_grids_cached(H_low, W_low)
-
-        # Start with sclera
-        colors = self.render_sclera(coords)
-
-        # Add iris
-        colors = self.render_iris(coords, colors)
-
-        # Add pupil
-        colors = self.render_pupil(coords, colors)
-
-        # Apply blink effect
-        colors = self.apply_blink_effect(coords, colors)
-
-        # Set invalid regions to black
-        colors[~coords['valid_mask']] = [0, 0, 0]
-
-        # Create low-resolution pygame surface
-        low_surface = pygame.Surface((W_low, H_low))
-        pygame.surfarray.blit_array(low_surface, colors.swapaxes(0, 1))
-
-        # Scale up to full resolution
-        surface = pygame.transform.scale(low_surface, (W, H))
-
-        return surface
\ No newline at end of file
+        sclera_template = get_sclera_template_cached(H_low, W_low, self.sclera_color)
+
+        # Both surfaces share the display's pixel format when it is 24/32-bit (as pixels3d
+        # requires), so scaling and the final blit take the fast same-format paths
+        if self._low_surface is None:
+            display = pygame.display.get_surface()
+            if display is not None and display.get_bitsize() in (24, 32):
+                self._low_surface = pygame.Surface((W_low, H_low), 0, display)
+                self._surface = pygame.Surface((W, H), 0, display)
+            else:
+                self._low_surface = pygame.Surface((W_low, H_low))
+                self._surface = pygame.Surface((W, H))
+
+        # Render straight into the low-resolution surface through an (H, W, 3) view
+        pixels = pygame.surfarray.pixels3d(self._low_surface)  # (width, height, 3) view, locks the surface
+        colors = pixels.transpose(1, 0, 2)
+
+        if _render_eye is not None:
+            # Eyelid rows from the exact per-row y values (same rows as apply_blink_effect)
+            top_rows, bottom_rows = self.get_eyelid_rows(coords)
+
+            _render_eye(colors, coords['col_x'], coords['row_y'], coords['valid_mask'],
+                        sclera_template, self.eye_phi * 0.8, self.eye_theta * 0.8,
+                        self.iris_radius, self.pupil_radius, self.iris_base_color,
+                        self.iris_dark_color, self.pupil_color, self.eyelid_color,
+                        top_rows, bottom_rows)
+        else:
+            # Start with sclera (already black outside the hemisphere)
+            np.copyto(colors, sclera_template)
+
+            # Add iris and pupil, then eyelids, in place
+            self.render_iris_and_pupil(coords, colors)
+            self.apply_blink_effect(coords, colors)
+
+        del colors, pixels  # unlock
+
+        # Scale up into the persistent full-resolution surface
+        pygame.transform.scale(self._low_surface, (W, H), self._surface)
+
+        return self._surface
\ No newline at end of file
@@ -9,10 +9,16 @@ import sys
 import math
 import random
 import time
+import array
 import cProfile
 import pstats
 from io import StringIO
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the renderer falls back to NumPy
+    njit = None
+
 # Screen dimensions (from your setup)
 H, W = 720, 1280
 
@@ -42,28 +48,132 @@ def get_fullscreen_coords_cached(decimation=4):
         brightness = (1.0 - 0.1 * np.clip(center_distance, 0, 1)).astype(np.float32)
         sclera_img = (sclera_rgb * brightness[:, :, None]).astype(np.uint8)
 
-        # Pre-compute eyelid masks for different blink states
-        eyelid_masks = {}
-        blink_steps = 20  # Number of pre-computed blink positions
-        for i in range(blink_steps + 1):
-            blink_state = i / blink_steps  # 0.0 to 1.0
-            if blink_state > 0.0:
-                blink_threshold = 0.6 * (1 - blink_state)
-                eyelid_mask = (norm_y > blink_threshold) | (norm_y < -blink_threshold)
-                eyelid_masks[blink_state] = eyelid_mask
-
         _coord_cache[cache_key] = {
             'norm_x': norm_x,
             'norm_y': norm_y,
             'center_distance': center_distance,
             'H_render': H_render,
             'W_render': W_render,
-            'eyelid_masks': eyelid_masks,
+            'row_y': norm_y[:, 0],  # Increasing normalized y of each row (eyelid row bounds)
             'sclera_img': sclera_img
         }
 
     return _coord_cache[cache_key]
 
+# Global cache for pre-shaded iris sprites
+_iris_sprite_cache = {}
+
+def get_iris_sprite_cached(decimation, iris_radius_x, iris_radius_y, iris_base_color, iris_dark_color):
+    """Get a pre-shaded RGB iris sprite centered on a pixel and its elliptical mask, using cache if available"""
+    H_render = H // decimation
+    W_render = W // decimation
+    cache_key = (H_render, W_render, iris_radius_x, iris_radius_y,
+                 tuple(iris_base_color), tuple(iris_dark_color))
+
+    if cache_key not in _iris_sprite_cache:
+        # Sprite half-extent in pixels (normalized coordinates step 1/(W_render/2) and 1/(H_render/2))
+        half_w = int(math.ceil(iris_radius_x * W_render / 2))
+        half_h = int(math.ceil(iris_radius_y * H_render / 2))
+        dx = (np.arange(-half_w, half_w + 1, dtype=np.float32) / (W_render / 2))[None, :]
+        dy = (np.arange(-half_h, half_h + 1, dtype=np.float32) / (H_render / 2))[:, None]
+
+        # Elliptical iris mask
+        iris_distance_squared = (dx / iris_radius_x)**2 + (dy / iris_radius_y)**2
+        iris_mask = iris_distance_squared <= 1.0
+
+        # Radial pattern and angular pattern relative to iris center
+        radial_pattern = np.sin(np.sqrt(iris_distance_squared) * 8 * np.pi) * 0.3 + 0.7
+        angular_pattern = np.sin(np.arctan2(dy, dx) * 12) * 0.2 + 0.8
+        combined_pattern = (radial_pattern * angular_pattern)[:, :, None]
+
+        base_color = np.array(iris_base_color, dtype=np.float32)
+        dark_color = np.array(iris_dark_color, dtype=np.float32)
+        sprite = np.clip(base_color * combined_pattern + dark_color * (1 - combined_pattern),
+                         0, 255).astype(np.uint8)
+
+        _iris_sprite_cache[cache_key] = {
+            'half_w': half_w,
+            'half_h': half_h,
+            'sprite': sprite,
+            'mask': iris_mask[:, :, None]
+        }
+
+    return _iris_sprite_cache[cache_key]
+
+# Global cache for pupil masks, one per discrete pupil_scale step
+_pupil_mask_cache = {}
+
+def get_pupil_masks_cached(decimation, pupil_radius_x, pupil_radius_y):
+    """Get elliptical pupil masks centered on a pixel keyed by round(pupil_scale * 10), using cache if available"""
+    H_render = H // decimation
+    W_render = W // decimation
+    cache_key = (H_render, W_render, pupil_radius_x, pupil_radius_y)
+
+    if cache_key not in _pupil_mask_cache:
+        pupil_masks = {}
+        # pupil_scale moves in 0.1 steps between 0.6 and 1.4
+        for scale_index in range(6, 15):
+            radius_x = pupil_radius_x * scale_index / 10
+            radius_y = pupil_radius_y * scale_index / 10
+            half_w = int(math.ceil(radius_x * W_render / 2))
+            half_h = int(math.ceil(radius_y * H_render / 2))
+            dx = (np.arange(-half_w, half_w + 1, dtype=np.float32) / (W_render / 2))[None, :]
+            dy = (np.arange(-half_h, half_h + 1, dtype=np.float32) / (H_render / 2))[:, None]
+            pupil_masks[scale_index] = {
+                'half_w': half_w,
+                'half_h': half_h,
+                'mask': (dx / radius_x)**2 + (dy / radius_y)**2 <= 1.0
+            }
+
+        _pupil_mask_cache[cache_key] = pupil_masks
+
+    return _pupil_mask_cache[cache_key]
+
+def stamp_windows(center_px, center_py, half_w, half_h, W_render, H_render):
+    """Clip a (2*half_h+1, 2*half_w+1) stamp centered on a pixel to the frame
+
+    Returns (frame_window, stamp_window) slice pairs, or None if the stamp is
+    entirely off-frame.
+    """
+    x0, x1 = max(center_px - half_w, 0), min(center_px + half_w + 1, W_render)
+    y0, y1 = max(center_py - half_h, 0), min(center_py + half_h + 1, H_render)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    sx, sy = x0 - center_px + half_w, y0 - center_py + half_h
+    return ((slice(y0, y1), slice(x0, x1)),
+            (slice(sy, sy + y1 - y0), slice(sx, sx + x1 - x0)))
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _render_iris_and_pupil(roi_colors, roi_norm_x, roi_norm_y, iris_center_x, iris_center_y,
+                               iris_radius_x, iris_radius_y, pupil_radius_x, pupil_radius_y,
+                               iris_base_color, iris_dark_color, pupil_color):
+        """Shade the elliptical iris and pupil into roi_colors in one fused per-pixel pass"""
+        rows, cols = roi_norm_x.shape
+        for y in prange(rows):
+            for x in range(cols):
+                dx = roi_norm_x[y, x] - iris_center_x
+                dy = roi_norm_y[y, x] - iris_center_y
+                ex = dx / iris_radius_x
+                ey = dy / iris_radius_y
+                distance_squared = ex * ex + ey * ey
+                px = dx / pupil_radius_x
+                py = dy / pupil_radius_y
+                if px * px + py * py <= 1.0:
+                    for c in range(3):
+                        roi_colors[y, x, c] = pupil_color[c]
+                elif distance_squared <= 1.0:
+                    # Radial pattern and angular pattern relative to iris center
+                    radial = math.sin(math.sqrt(distance_squared) * 8 * math.pi) * 0.3 + 0.7
+                    angular = math.sin(math.atan2(dy, dx) * 12) * 0.2 + 0.8
+                    pattern = radial * angular
+                    # Convex blend of two uint8 colors, so always in range
+                    for c in range(3):
+                        value = iris_base_color[c] * pattern + iris_dark_color[c] * (1 - pattern)
+                        roi_colors[y, x, c] = np.uint8(value)
+else:
+    _render_iris_and_pupil = None
+
 class FullscreenEyeballRenderer:
     """Renders eyeball using full rectangular screen space"""
 
@@ -86,11 +196,12 @@ class FullscreenEyeballRenderer:
         self.target_x = 0.0
         self.target_y = 0.0
         self.max_eye_movement = 0.3  # Maximum eye movement
-        self.movement_speed = 0.05
+        self.movement_speed = 0.05  # Fraction of the way to the target per animation frame
 
         # Animation state
         self.blink_state = 0.0  # 0 = open, 1 = closed
-        self.blink_speed = 0.2  # Original blink speed
+        self.blink_speed = 0.2  # Original blink speed (blink_state change per animation frame)
+        self.animation_fps = 30.0  # Frame rate the speeds above are tuned for
         self.next_blink_time = 0.5  # Start with a blink at 0.5 seconds
 
         # Colors
@@ -104,6 +215,10 @@ class FullscreenEyeballRenderer:
         self.last_movement_time = -1.0  # Negative time to trigger immediate movement
         self.movement_interval = 0.0  # Will trigger on first update
 
+        # Time of the last movement/blink update, so animation speed does not depend on frame rate
+        self.last_movement_update = 0.0
+        self.last_blink_update = 0.0
+
         # Persistent surface (no per-frame allocations)
         H_render = H // decimation
         W_render = W // decimation
@@ -113,6 +228,20 @@ class FullscreenEyeballRenderer:
         coords = get_fullscreen_coords_cached(decimation)
         self.sclera_img = coords['sclera_img']
 
+        # The surface's pixels are the frame buffer: start from the sclera, then restore
+        # only the regions drawn over in the previous frame
+        pygame.surfarray.blit_array(self.surface, self.sclera_img.swapaxes(0, 1))
+        self.dirty_windows = []
+
+        # Full-resolution surface returned to callers (same pixel format, scaled into every frame),
+        # the state it was rendered with, and whether the last call re-rendered
+        if decimation > 1:
+            self.eyeball_surface = pygame.Surface((W, H), 0, self.surface)
+        else:
+            self.eyeball_surface = self.surface
+        self.render_state = None
+        self.frame_changed = True
+
     def update_eye_movement(self, current_time):
         """Update eye movement with realistic saccadic motion"""
         # Check if it's time for a new movement
@@ -123,12 +252,16 @@ class FullscreenEyeballRenderer:
             self.last_movement_time = current_time
             self.movement_interval = random.uniform(2.0, 5.0)
 
-        # Smooth interpolation to target
+        # Smooth interpolation to target, scaled to the animation frames elapsed since the last update
+        frames = max(0.0, current_time - self.last_movement_update) * self.animation_fps
+        self.last_movement_update = current_time
+        step = 1.0 - (1.0 - self.movement_speed) ** frames
+
         x_diff = self.target_x - self.eye_x
         y_diff = self.target_y - self.eye_y
 
-        self.eye_x += x_diff * self.movement_speed
-        self.eye_y += y_diff * self.movement_speed
+        self.eye_x += x_diff * step
+        self.eye_y += y_diff * step
 
     def update_blinking(self, current_time):
         """Update blinking animation"""
@@ -142,15 +275,19 @@ class FullscreenEyeballRenderer:
             self.blink_state = 0.01  # Start closing
             self.blink_closing = True
 
+        # Blink progress for the animation frames elapsed since the last update
+        step = max(0.0, current_time - self.last_blink_update) * self.animation_fps * self.blink_speed
+        self.last_blink_update = current_time
+
         # Handle blink animation
         if hasattr(self, 'blink_closing') and self.blink_closing:
             # Closing phase
-            self.blink_state = min(1.0, self.blink_state + self.blink_speed)
+            self.blink_state = min(1.0, self.blink_state + step)
             if self.blink_state >= 1.0:
                 self.blink_closing = False  # Switch to opening
         elif self.blink_state > 0.0:
             # Opening phase
-            self.blink_state = max(0.0, self.blink_state - self.blink_speed)
+            self.blink_state = max(0.0, self.blink_state - step)
             if self.blink_state <= 0.0:
                 # Blink complete, schedule next one
                 self.next_blink_time = current_time + random.uniform(3.0, 6.0)
@@ -161,6 +298,15 @@ class FullscreenEyeballRenderer:
         self.update_eye_movement(current_time)
         self.update_blinking(current_time)
 
+        # Reuse the last frame while nothing visible has changed (eye holding still between saccades)
+        render_state = (round(self.eye_x, 3), round(self.eye_y, 3), round(self.pupil_scale, 2),
+                        round(self.blink_state, 2), self.iris_base_color, self.iris_dark_color,
+                        self.pupil_color, self.eyelid_color)
+        self.frame_changed = render_state != self.render_state
+        if not self.frame_changed:
+            return self.eyeball_surface
+        self.render_state = render_state
+
         # Get cached coordinate grids with decimation
         coords = get_fullscreen_coords_cached(self.decimation)
         norm_x = coords['norm_x']
@@ -169,8 +315,14 @@ class FullscreenEyeballRenderer:
         H_render = coords['H_render']
         W_render = coords['W_render']
 
-        # Start from precomputed sclera image (eliminates expensive np.clip operations)
-        colors = np.copy(self.sclera_img)
+        # Render straight into the surface through an (H, W, 3) view of its pixels
+        pixels = pygame.surfarray.pixels3d(self.surface)  # (width, height, 3) view, locks the surface
+        colors = pixels.transpose(1, 0, 2)
+
+        # Restore the sclera only where the previous frame drew over it
+        for window in self.dirty_windows:
+            np.copyto(colors[window], self.sclera_img[window])
+        dirty_windows = self.dirty_windows = []
 
         # Calculate iris center based on eye movement
         iris_center_x = self.eye_x
@@ -186,73 +338,136 @@ class FullscreenEyeballRenderer:
         # Work only on ROI slices
         roi_norm_x = norm_x[y_min:y_max, x_min:x_max]
         roi_norm_y = norm_y[y_min:y_max, x_min:x_max]
-
-        # Create iris mask (elliptical) - only on ROI
-        iris_dist_x = (roi_norm_x - iris_center_x) / self.iris_radius_x
-        iris_dist_y = (roi_norm_y - iris_center_y) / self.iris_radius_y
-        iris_distance_squared = iris_dist_x**2 + iris_dist_y**2
-        iris_mask = iris_distance_squared <= 1.0
-
-        if np.any(iris_mask):
-            # Create iris texture - only calculate sqrt where needed
-            iris_radius_norm = np.sqrt(iris_distance_squared[iris_mask])
-
-            # Radial pattern
-            radial_pattern = np.sin(iris_radius_norm * 8 * np.pi) * 0.3 + 0.7
-
-            # Angular pattern relative to iris center
-            iris_azimuth = np.arctan2(roi_norm_y[iris_mask] - iris_center_y,
-                                    roi_norm_x[iris_mask] - iris_center_x)
-            angular_pattern = np.sin(iris_azimuth * 12) * 0.2 + 0.8
-
-            # Combine patterns
-            combined_pattern = radial_pattern * angular_pattern
-
-            # Apply iris colors to ROI region
-            roi_colors = colors[y_min:y_max, x_min:x_max]
-            for i in range(3):
-                base_color = self.iris_base_color[i]
-                dark_color = self.iris_dark_color[i]
-                iris_color = base_color * combined_pattern + dark_color * (1 - combined_pattern)
-                roi_colors[iris_mask, i] = np.clip(iris_color, 0, 255).astype(np.uint8)
-
-        # Create pupil mask (smaller ellipse) - reuse ROI
-        pupil_radius_x = self.pupil_radius_x * self.pupil_scale
-        pupil_radius_y = self.pupil_radius_y * self.pupil_scale
-        pupil_dist_x = (roi_norm_x - iris_center_x) / pupil_radius_x
-        pupil_dist_y = (roi_norm_y - iris_center_y) / pupil_radius_y
-        pupil_distance_squared = pupil_dist_x**2 + pupil_dist_y**2
-        pupil_mask = pupil_distance_squared <= 1.0
-
-        if np.any(pupil_mask):
-            roi_colors[pupil_mask] = self.pupil_color
-
-        # Apply blink effect (eyelids) - using precomputed masks
+        roi_colors = colors[y_min:y_max, x_min:x_max]
+
+        if _render_iris_and_pupil is not None:
+            # float32 scalars keep the kernel's arithmetic in the grids' precision
+            _render_iris_and_pupil(roi_colors, roi_norm_x, roi_norm_y,
+                                   np.float32(iris_center_x), np.float32(iris_center_y),
+                                   np.float32(self.iris_radius_x), np.float32(self.iris_radius_y),
+                                   np.float32(self.pupil_radius_x * self.pupil_scale),
+                                   np.float32(self.pupil_radius_y * self.pupil_scale),
+                                   self.iris_base_color, self.iris_dark_color, self.pupil_color)
+            dirty_windows.append((slice(y_min, y_max), slice(x_min, x_max)))
+        else:
+            # Iris center snapped to the nearest render pixel, for the cached stamps
+            center_px = int(round((iris_center_x + 1) * W_render / 2))
+            center_py = int(round((iris_center_y + 1) * H_render / 2))
+
+            # Paste the pre-shaded iris sprite at the snapped iris center
+            iris = get_iris_sprite_cached(self.decimation, self.iris_radius_x, self.iris_radius_y,
+                                          self.iris_base_color, self.iris_dark_color)
+            windows = stamp_windows(center_px, center_py, iris['half_w'], iris['half_h'],
+                                    W_render, H_render)
+            if windows is not None:
+                frame_window, sprite_window = windows
+                np.copyto(colors[frame_window], iris['sprite'][sprite_window],
+                          where=iris['mask'][sprite_window])
+                dirty_windows.append(frame_window)
+
+            # Look up the precomputed pupil mask for the current (0.1-step) pupil scale
+            pupil_masks = get_pupil_masks_cached(self.decimation, self.pupil_radius_x, self.pupil_radius_y)
+            pupil = pupil_masks[round(self.pupil_scale * 10)]
+            windows = stamp_windows(center_px, center_py, pupil['half_w'], pupil['half_h'],
+                                    W_render, H_render)
+            if windows is not None:
+                frame_window, mask_window = windows
+                colors[frame_window][pupil['mask'][mask_window]] = self.pupil_color
+                dirty_windows.append(frame_window)
+
+        # Apply blink effect (eyelids): whole rows above -thr and below +thr
         if self.blink_state > 0.0:
-            # Find closest precomputed blink state
+            # Index of the closest of 20 discrete blink steps
             blink_steps = 20
-            blink_index = round(self.blink_state * blink_steps) / blink_steps
+            blink_index = int(round(self.blink_state * blink_steps))
 
-            # Use precomputed eyelid mask
-            eyelid_masks = coords['eyelid_masks']
-            if blink_index in eyelid_masks:
-                eyelid_mask = eyelid_masks[blink_index]
-                colors[eyelid_mask] = self.eyelid_color
+            if blink_index > 0:
+                blink_threshold = np.float32(0.6 * (1 - blink_index / blink_steps))
+                row_y = coords['row_y']
+                top = np.searchsorted(row_y, -blink_threshold, side='left')
+                bottom = np.searchsorted(row_y, blink_threshold, side='right')
+                colors[:top] = self.eyelid_color
+                colors[bottom:] = self.eyelid_color
+                dirty_windows.append((slice(0, top), slice(None)))
+                dirty_windows.append((slice(bottom, None), slice(None)))
 
-        # Write pixels into the persistent surface (no new Surface allocation)
-        pygame.surfarray.blit_array(self.surface, colors.swapaxes(0, 1))
+        del colors, roi_colors, pixels  # unlock
 
-        # Scale up to full resolution if decimation > 1
+        # Scale up into the persistent full-resolution surface if decimation > 1
         if self.decimation > 1:
-            scaled_surface = pygame.transform.scale(self.surface, (W, H))
-            return scaled_surface
-        else:
-            return self.surface
+            pygame.transform.scale(self.surface, (W, H), self.eyeball_surface)
+        return self.eyeball_surface
+
+class GLEyeballRenderer:
+    """Draws a FullscreenEyeballRenderer's eye with the gpu_eyeball.py fragment shader
+
+    Needs PyOpenGL and a display opened with pygame.OPENGL; renders at full
+    resolution on the GPU, so decimation does not apply.
+    """
+
+    def __init__(self, eyeball):
+        from gpu_eyeball import VERT_SRC, FRAG_SRC, make_program, gl
+
+        self.eyeball = eyeball
+        self.gl = gl
+        self.program = make_program(VERT_SRC, FRAG_SRC)
+        gl.glUseProgram(self.program)
+
+        # Full-screen triangle (covers NDC)
+        verts = (-1.0, -1.0, 3.0, -1.0, -1.0, 3.0)
+        vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, array.array('f', verts).tobytes(), gl.GL_STATIC_DRAW)
+
+        loc_pos = gl.glGetAttribLocation(self.program, "a_pos")
+        gl.glEnableVertexAttribArray(loc_pos)
+        gl.glVertexAttribPointer(loc_pos, 2, gl.GL_FLOAT, False, 0, None)
+
+        # Uniform locations
+        self.uniforms = {name: gl.glGetUniformLocation(self.program, name) for name in (
+            'u_res', 'u_state', 'u_sclera', 'u_iris_base', 'u_iris_dark', 'u_lid')}
+
+        # Per-frame uniform block (see u_state in FRAG_SRC) and the colours last uploaded
+        self.state = np.zeros((2, 4), dtype=np.float32)
+        self.colors = None
+
+        # Static state
+        gl.glUniform2f(self.uniforms['u_res'], float(W), float(H))
+        gl.glViewport(0, 0, W, H)
+        gl.glDisable(gl.GL_DEPTH_TEST)
+
+    def draw(self, current_time):
+        """Advance the eye animation and draw one frame to the OpenGL display"""
+        eyeball = self.eyeball
+        eyeball.update_eye_movement(current_time)
+        eyeball.update_blinking(current_time)
+
+        gl = self.gl
+        u = self.uniforms
+        # All per-frame state in one upload; shader y axis points up, the CPU renderer's points down
+        state = self.state
+        state[0] = eyeball.eye_x, -eyeball.eye_y, eyeball.iris_radius_x, eyeball.iris_radius_y
+        state[1] = (eyeball.pupil_radius_x * eyeball.pupil_scale,
+                    eyeball.pupil_radius_y * eyeball.pupil_scale, eyeball.blink_state, current_time)
+        gl.glUniform4fv(u['u_state'], 2, state)
+
+        # Colours only change between runs, so upload them only when they differ
+        colors = (eyeball.sclera_color, eyeball.iris_base_color, eyeball.iris_dark_color,
+                  eyeball.eyelid_color)
+        if colors != self.colors:
+            self.colors = colors
+            gl.glUniform3f(u['u_sclera'], *(c / 255.0 for c in eyeball.sclera_color))
+            gl.glUniform3f(u['u_iris_base'], *map(float, eyeball.iris_base_color))
+            gl.glUniform3f(u['u_iris_dark'], *map(float, eyeball.iris_dark_color))
+            gl.glUniform3f(u['u_lid'], *map(float, eyeball.eyelid_color))
+
+        gl.glDrawArrays(gl.GL_TRIANGLES, 0, 3)
 
 def main():
     # Parse command line arguments
     windowed_mode = '--windowed' in sys.argv
     profile_mode = '--profile' in sys.argv
+    gl_mode = '--gl' in sys.argv  # Draw with the OpenGL shader instead of the CPU renderer
 
     # Parse decimation level
     decimation = 3  # Default 3x decimation for good balance
@@ -293,11 +508,24 @@ def main():
     # Initialize pygame
     pygame.init()
 
-    # Set up display
-    if windowed_mode:
-        screen = pygame.display.set_mode((W, H))
+    # Create eyeball renderer with decimation
+    eyeball = FullscreenEyeballRenderer(decimation)
+
+    # Set up display: CPU renderer, or the GPU shader with --gl when an OpenGL display opens
+    flags = 0 if windowed_mode else pygame.FULLSCREEN
+    gl_renderer = None
+    if gl_mode:
+        try:
+            screen = pygame.display.set_mode((W, H), flags | pygame.OPENGL | pygame.DOUBLEBUF)
+        except pygame.error as e:  # No OpenGL context on this display
+            print(f"OpenGL display unavailable ({e}), falling back to CPU renderer")
+        else:
+            gl_renderer = GLEyeballRenderer(eyeball)
+    if gl_renderer is None:
+        screen = pygame.display.set_mode((W, H), flags)
+        print(f"Renderer: CPU (decimation={decimation})")
     else:
-        screen = pygame.display.set_mode((W, H), pygame.FULLSCREEN)
+        print("Renderer: OpenGL fragment shader (full resolution; decimation and info overlay unused)")
 
     pygame.display.set_caption(f"Full-screen Eyeball - {eye_color.title()}")
 
@@ -307,9 +535,6 @@ def main():
 
     clock = pygame.time.Clock()
 
-    # Create eyeball renderer with decimation
-    eyeball = FullscreenEyeballRenderer(decimation)
-
     # Set eye color
     if eye_color in eye_colors:
         eyeball.iris_base_color, eyeball.iris_dark_color = eye_colors[eye_color]
@@ -322,6 +547,7 @@ def main():
     total_render_time = 0.0
     fps_update_interval = 30  # Update FPS every N frames
     last_fps_update = start_time
+    hud_rect = None  # Screen area covered by the info overlay last frame
 
     running = True
     while running:
@@ -367,19 +593,26 @@ def main():
         # Calculate current time
         current_time = (pygame.time.get_ticks() - start_time) / 1000.0
 
-        # Clear screen and draw eyeball
-        screen.fill(BLACK)
-
         # Measure eyeball rendering performance
         render_start = time.perf_counter()
-        eyeball_surface = eyeball.create_eyeball_surface(current_time)
+        if gl_renderer is not None:
+            gl_renderer.draw(current_time)
+        else:
+            eyeball_surface = eyeball.create_eyeball_surface(current_time)
         render_end = time.perf_counter()
 
         render_time_ms = (render_end - render_start) * 1000
         total_render_time += render_time_ms
         frame_count += 1
 
-        screen.blit(eyeball_surface, (0, 0))
+        if gl_renderer is None:
+            if eyeball.frame_changed:
+                # Clear screen and draw eyeball
+                screen.fill(BLACK)
+                screen.blit(eyeball_surface, (0, 0))
+            elif hud_rect is not None:
+                # Unchanged eye: only restore the pixels under last frame's info overlay
+                screen.blit(eyeball_surface, hud_rect, hud_rect)
 
         # Calculate and display performance info
         current_fps = 0.0
@@ -394,25 +627,28 @@ def main():
         if frame_count % fps_update_interval == 0:
             last_fps_update = pygame.time.get_ticks()
 
-        # Display info in corner
-        font = pygame.font.Font(None, 24)
-        render_res = f"{W//decimation}x{H//decimation}"
-        info_lines = [
-            f"Full-screen {eye_color.title()} Eye",
-            f"Decimation: {decimation} ({render_res})",
-            f"FPS: {current_fps:.1f}" if current_fps > 0 else "FPS: Calculating...",
-            f"Render: {render_time_ms:.2f}ms",
-            f"Avg Render: {avg_render_time:.2f}ms",
-            f"Position: ({eyeball.eye_x:.2f}, {eyeball.eye_y:.2f})",
-            f"Pupil: {eyeball.pupil_scale:.2f}",
-            f"Blink: {eyeball.blink_state:.2f}",
-        ]
-
-        y_offset = 10
-        for line in info_lines:
-            text = font.render(line, True, WHITE)
-            screen.blit(text, (10, y_offset))
-            y_offset += 25
+        # Info overlay (CPU renderer only; the OpenGL display cannot take surface blits)
+        if gl_renderer is None:
+            font = pygame.font.Font(None, 24)
+            render_res = f"{W//decimation}x{H//decimation}"
+            info_lines = [
+                f"Full-screen {eye_color.title()} Eye",
+                f"Decimation: {decimation} ({render_res})",
+                f"FPS: {current_fps:.1f}" if current_fps > 0 else "FPS: Calculating...",
+                f"Render: {render_time_ms:.2f}ms",
+                f"Avg Render: {avg_render_time:.2f}ms",
+                f"Position: ({eyeball.eye_x:.2f}, {eyeball.eye_y:.2f})",
+                f"Pupil: {eyeball.pupil_scale:.2f}",
+                f"Blink: {eyeball.blink_state:.2f}",
+            ]
+
+            y_offset = 10
+            text_rects = []
+            for line in info_lines:
+                text = font.render(line, True, WHITE)
+                text_rects.append(screen.blit(text, (10, y_offset)))
+                y_offset += 25
+            hud_rect = text_rects[0].unionall(text_rects[1:])
 
         pygame.display.flip()
         clock.tick(30)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import math, random, time, sys
+import numpy as np
 import pygame
 from pygame.locals import DOUBLEBUF, OPENGL, FULLSCREEN
 from OpenGL import GL as gl
@@ -21,12 +22,9 @@ precision mediump float;
 
 /* Uniforms */
 uniform vec2  u_res;          // screen resolution
-uniform float u_time;         // seconds
-uniform vec2  u_eye;          // eye center in [-1,1] coords
-uniform vec2  u_iris_r;       // iris radii in normalized coords
-uniform vec2  u_pupil_r;      // pupil radii in normalized coords (base)
-uniform float u_pupil_scale;  // pupil scale
-uniform float u_blink;        // 0..1
+uniform vec4  u_state[2];     // per-frame state, uploaded with one glUniform4fv:
+                              // [0] = eye center in [-1,1] coords (xy), iris radii in normalized coords (zw)
+                              // [1] = scaled pupil radii (xy), blink 0..1 (z), time in seconds (w)
 uniform vec3  u_sclera;       // 248,248,255
 uniform vec3  u_iris_base;    // e.g., 34,139,34
 uniform vec3  u_iris_dark;    // e.g., 0,100,0
@@ -42,6 +40,10 @@ float sdEllipse(vec2 p, vec2 r) {
 void main() {
   // Normalized pixel coords in [-1,1]
   vec2 uv = (gl_FragCoord.xy / u_res) * 2.0 - 1.0;
+  vec2 eye = u_state[0].xy;
+  vec2 iris_r = u_state[0].zw;
+  vec2 pupil_r = u_state[1].xy;
+  float blink = u_state[1].z;
 
   // Sclera gradient (radial falloff from screen center, NOT eyeball center)
   float d = length(uv);
@@ -49,19 +51,19 @@ void main() {
   vec3 color = u_sclera * bright;
 
   // Eyelids (fast path): close from top+bottom
-  // Threshold is symmetric in normalized Y; higher u_blink -> more closed
-  float thr = 0.6 * (1.0 - u_blink);
-  if (u_blink > 0.0 && (uv.y >  thr || uv.y < -thr)) {
+  // Threshold is symmetric in normalized Y; higher blink -> more closed
+  float thr = 0.6 * (1.0 - blink);
+  if (blink > 0.0 && (uv.y >  thr || uv.y < -thr)) {
     gl_FragColor = vec4(u_lid/255.0, 1.0);
     return;
   }
 
   // Eye-relative coordinates
-  vec2 p   = uv - u_eye;
+  vec2 p   = uv - eye;
 
   // IRIS
   // Elliptical normalized coordinates
-  vec2 pe  = p / u_iris_r;
+  vec2 pe  = p / iris_r;
   float r2 = dot(pe, pe);
   if (r2 <= 1.0) {
     float r  = sqrt(max(r2, 1e-6));
@@ -81,8 +83,7 @@ void main() {
   }
 
   // PUPIL (overrides iris)
-  vec2 pr = u_pupil_r * u_pupil_scale;
-  float pupil_d = sdEllipse(p, pr);
+  float pupil_d = sdEllipse(p, pupil_r);
   if (pupil_d <= 0.0) {
     color = vec3(0.0);
   }
@@ -135,12 +136,7 @@ def main():
 
     # Uniform locations
     u_res          = gl.glGetUniformLocation(prog, "u_res")
-    u_time         = gl.glGetUniformLocation(prog, "u_time")
-    u_eye          = gl.glGetUniformLocation(prog, "u_eye")
-    u_iris_r       = gl.glGetUniformLocation(prog, "u_iris_r")
-    u_pupil_r      = gl.glGetUniformLocation(prog, "u_pupil_r")
-    u_pupil_scale  = gl.glGetUniformLocation(prog, "u_pupil_scale")
-    u_blink        = gl.glGetUniformLocation(prog, "u_blink")
+    u_state        = gl.glGetUniformLocation(prog, "u_state")
     u_sclera       = gl.glGetUniformLocation(prog, "u_sclera")
     u_iris_base    = gl.glGetUniformLocation(prog, "u_iris_base")
     u_iris_dark    = gl.glGetUniformLocation(prog, "u_iris_dark")
@@ -186,6 +182,9 @@ def main():
     next_blink = 0.5   # first blink at 0.5s
     blink_closing = False
 
+    # Per-frame uniform block (see u_state in FRAG_SRC), reused every frame
+    state = np.zeros((2, 4), dtype=np.float32)
+
     clock = pygame.time.Clock()
     t0 = time.perf_counter()
     running = True
@@ -231,13 +230,10 @@ def main():
             if blink <= 0.0:
                 next_blink = t + random.uniform(3.0, 6.0)
 
-        # Upload uniforms
-        gl.glUniform1f(u_time, float(t))
-        gl.glUniform2f(u_eye, float(eye_x), float(eye_y))
-        gl.glUniform2f(u_iris_r, float(iris_rx), float(iris_ry))
-        gl.glUniform2f(u_pupil_r, float(pupil_rx), float(pupil_ry))
-        gl.glUniform1f(u_pupil_scale, float(pupil_scale))
-        gl.glUniform1f(u_blink, float(blink))
+        # Upload uniforms (one call for all per-frame state)
+        state[0] = eye_x, eye_y, iris_rx, iris_ry
+        state[1] = pupil_rx * pupil_scale, pupil_ry * pupil_scale, blink, t
+        gl.glUniform4fv(u_state, 2, state)
 
         # Draw
         gl.glViewport(0, 0, W, H)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Checks that the Numba eyeball kernel draws the same frame as the NumPy path
+Run with: python -m pytest toys
+"""
+import numpy as np
+import pytest
+
+import eyeball_core
+from eyeball_core import EyeballRenderer, get_coordinate_grids_cached, get_sclera_template_cached
+
+@pytest.mark.skipif(eyeball_core._render_eye is None, reason="Numba not installed")
+@pytest.mark.parametrize('blink_state', [0.0, 0.05, 0.3, 0.5, 0.75, 1.0])
+def test_numba_matches_numpy_at_blink(blink_state):
+    """Both paths agree pixel for pixel, eyelid rows included (eye centered on a pixel)"""
+    renderer = EyeballRenderer()
+    renderer.blink_state = blink_state
+    H_low, W_low = eyeball_core.H // 4, eyeball_core.W // 4
+    coords = get_coordinate_grids_cached(H_low, W_low)
+    sclera_template = get_sclera_template_cached(H_low, W_low, renderer.sclera_color)
+
+    expected = sclera_template.copy()
+    renderer.render_iris_and_pupil(coords, expected)
+    renderer.apply_blink_effect(coords, expected)
+
+    colors = np.zeros_like(expected)
+    top_rows, bottom_rows = renderer.get_eyelid_rows(coords)
+    eyeball_core._render_eye(colors, coords['col_x'], coords['row_y'], coords['valid_mask'],
+                             sclera_template, 0.0, 0.0, renderer.iris_radius,
+                             renderer.pupil_radius, renderer.iris_base_color,
+                             renderer.iris_dark_color, renderer.pupil_color,
+                             renderer.eyelid_color, top_rows, bottom_rows)
+
+    np.testing.assert_array_equal(colors, expected)
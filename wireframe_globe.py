@@ -6,159 +6,143 @@ Draws latitude/longitude grid lines for projector calibration with animation
 import pygame
 import numpy as np
 import sys
-import os
 import math
+from projection_utils import aep_batch, line_template, rotate_about_pole
+from projection_utils import H as AEP_H, W as AEP_W, SCALE_X as AEP_SCALE_X, SCALE_Y as AEP_SCALE_Y
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the grid is projected with NumPy instead
+    njit = None
 
 # Screen dimensions (from your setup)
 H, W = 720, 1280
 
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _project_lines_1280(forward, right, up, bounds, out, counts):
+        """Project polar-view cartesian samples of several lines straight to 1280x720 screen points
+
+        One pass doing aep_batch's projection plus the 640x480 -> 1280x720
+        scaling. Line k has samples bounds[k]:bounds[k+1]; its visible points
+        are written to out[bounds[k]:bounds[k] + counts[k]].
+        """
+        max_angle = math.pi / 2
+        max_screen_radius = min(AEP_W, AEP_H) / 2 * 0.9
+        for line in range(len(bounds) - 1):
+            n = bounds[line]
+            for i in range(bounds[line], bounds[line + 1]):
+                # Skip points behind the hemisphere
+                if forward[i] <= 0:
+                    continue
+                great_circle_angle = math.acos(min(forward[i], 1.0))
+                if great_circle_angle > max_angle:
+                    continue
+
+                # Azimuthal equidistant projection at 640x480
+                screen_radius = great_circle_angle / max_angle * max_screen_radius
+                azimuth = math.atan2(up[i], right[i])
+                screen_x = int(AEP_W / 2 + screen_radius * math.cos(azimuth) / AEP_SCALE_X)
+                screen_y = int(AEP_H / 2 - screen_radius * math.sin(azimuth) / AEP_SCALE_Y)  # flip y
+                if not (0 <= screen_x < AEP_W and 0 <= screen_y < AEP_H):
+                    continue
+
+                # Scale from 640x480 to 1280x720 (exact integer floor of screen * W / 640)
+                scaled_x = screen_x * W // 640
+                scaled_y = screen_y * H // 480
+                if 0 <= scaled_x < W and 0 <= scaled_y < H:
+                    out[n, 0] = scaled_x
+                    out[n, 1] = scaled_y
+                    n += 1
+            counts[line] = n - bounds[line]
+else:
+    _project_lines_1280 = None
+
+# Reused output buffers for _project_lines_1280, grown as needed
+_points_buffer = np.empty((0, 2), dtype=np.int32)
+_counts_buffer = np.empty(0, dtype=np.int64)
+
+# Concatenated unrotated samples for batched grids, keyed by the tuple of line keys
+_grid_cache = {}
+
 # Create scaled drawing functions that work at 1280x720 resolution
-def draw_azimuth_ring_polar_1280(surface, azimuth_deg, color, rotation_offset=0, num_points=200):
-    """Draw azimuth ring scaled for 1280x720 display"""
-    from projection_utils import azimuthal_equidistant_projection
+def _draw_lines_1280(surface, colors, forward, right, up, bounds):
+    """Project polar-view samples of several lines to 1280x720 and draw each in ONE pygame call"""
+    global _points_buffer, _counts_buffer
+
+    if _project_lines_1280 is not None:
+        if len(_points_buffer) < len(forward):
+            _points_buffer = np.empty((len(forward), 2), dtype=np.int32)
+        if len(_counts_buffer) < len(colors):
+            _counts_buffer = np.empty(len(colors), dtype=np.int64)
+        _project_lines_1280(forward, right, up, bounds, _points_buffer, _counts_buffer)
+        lines = [_points_buffer[start:start + count]
+                 for start, count in zip(bounds[:-1], _counts_buffer)]
+    else:
+        screen_x, screen_y, valid = aep_batch(forward, right, up)
 
-    points = []
-    theta = np.radians(azimuth_deg)  # great-circle angle from pole
+        # Scale from 640x480 to 1280x720 in place, in int32 (exact integer floor of screen * W / 640)
+        screen_x *= W
+        screen_x //= 640
+        screen_y *= H
+        screen_y //= 480
+        valid &= (screen_x >= 0) & (screen_x < W) & (screen_y >= 0) & (screen_y < H)
 
-    for i in range(num_points + 1):
-        phi = 2 * np.pi * i / num_points - np.pi + rotation_offset  # azimuth around pole
+        # Split back into per-line point arrays at the known boundaries
+        lines = [np.column_stack((screen_x[start:end][valid[start:end]],
+                                  screen_y[start:end][valid[start:end]]))
+                 for start, end in zip(bounds[:-1], bounds[1:])]
 
-        # Convert to cartesian (pole toward viewer at z=1)
-        x = np.sin(theta) * np.cos(phi)
-        y = np.sin(theta) * np.sin(phi)
-        z = np.cos(theta)
+    # Draw each entire polyline; pygame reads a list of pairs faster than an ndarray
+    for color, points in zip(colors, lines):
+        if len(points) > 1:
+            pygame.draw.lines(surface, color, False, points.tolist(), 1)
 
-        # Use the projection but scale for our screen size
-        temp_x, temp_y = azimuthal_equidistant_projection(z, x, y)
-        if temp_x is not None and temp_y is not None:
-            # Scale from 640x480 to 1280x720
-            scaled_x = int(temp_x * W / 640)
-            scaled_y = int(temp_y * H / 480)
-            if 0 <= scaled_x < W and 0 <= scaled_y < H:
-                points.append((scaled_x, scaled_y))
+def draw_azimuth_ring_polar_1280(surface, azimuth_deg, color, rotation_offset=0, num_points=200):
+    """Draw azimuth ring scaled for 1280x720 display"""
+    # Cached cartesian samples (pole toward viewer at z=1), rotated with one sin/cos of the offset
+    x, y, z = line_template('azimuth_polar', azimuth_deg, num_points)
+    x, y = rotate_about_pole(x, y, rotation_offset)
 
-    # Draw entire polyline
-    if len(points) > 1:
-        pygame.draw.lines(surface, color, False, points, 1)
+    # Project with the pole toward the viewer (z forward)
+    _draw_lines_1280(surface, [color], z, x, y, np.array([0, len(z)]))
 
 def draw_longitude_line_polar_1280(surface, lon_deg, color, rotation_offset=0, num_points=144):
     """Draw longitude line scaled for 1280x720 display"""
-    from projection_utils import azimuthal_equidistant_projection
-
-    points = []
-    phi = np.radians(lon_deg) + rotation_offset
-
-    for i in range(num_points + 1):
-        lat_deg = 90 - 180 * i / num_points  # latitude from 90 to -90
-        theta = np.radians(90 - lat_deg)     # polar angle
-
-        # Convert to cartesian (pole toward viewer)
-        x = np.sin(theta) * np.cos(phi)
-        y = np.sin(theta) * np.sin(phi)
-        z = np.cos(theta)
-
-        # Use the projection but scale for our screen size
-        temp_x, temp_y = azimuthal_equidistant_projection(z, x, y)
-        if temp_x is not None and temp_y is not None:
-            # Scale from 640x480 to 1280x720
-            scaled_x = int(temp_x * W / 640)
-            scaled_y = int(temp_y * H / 480)
-            if 0 <= scaled_x < W and 0 <= scaled_y < H:
-                points.append((scaled_x, scaled_y))
-
-    # Draw entire polyline
-    if len(points) > 1:
-        pygame.draw.lines(surface, color, False, points, 1)
-
-def gnomonic_projection():
-    """Generate gnomonic projection mapping from screen to sphere"""
-    # FOV mapping: screen coordinates to gnomonic plane (doubled FOV for hemispherical display)
-    # Start with 4:3 aspect ratio, then stretch to fill 16:9, with doubled field of view
-    base_aspect = 4.0/3.0  # Original calibration video aspect ratio
-    fov_scale = 2.0  # Double the field of view to match hemispherical calibration
-    u = np.linspace(-base_aspect * SCALE_X * fov_scale, base_aspect * SCALE_X * fov_scale, W)
-    v = np.linspace(-SCALE_Y * fov_scale, SCALE_Y * fov_scale, H)
-    U, V = np.meshgrid(u, v)
-
-    # Gnomonic projection: pixel maps to direction vector (X, Y, Z)
-    norm = np.sqrt(1 + U**2 + V**2)
-    X = 1 / norm
-    Y = U / norm
-    Z = V / norm
-
-    # Mask points behind the projection plane (grazing angle filter)
-    mask = X < 0
-    X[mask] = np.nan
-    Y[mask] = np.nan
-    Z[mask] = np.nan
-
-    # Convert to spherical coordinates
-    theta = np.arccos(np.clip(Z, -1, 1))  # polar angle [0, π]
-    phi = np.arctan2(Y, X)                # azimuth [-π, π]
-
-    return theta, phi, mask
-
-def sphere_to_screen(theta, phi, rotation_offset=0):
-    """Convert spherical coordinates back to screen coordinates with rotation"""
-    # Apply rotation around z-axis (vertical)
-    phi_rotated = phi + rotation_offset
-
-    # Convert spherical to cartesian with pole at center (rotate theta by pi/2)
-    # This puts the north pole (theta=0) at the center of the view
-    x = np.cos(theta)                        # forward direction (pole at center)
-    y = np.sin(phi_rotated) * np.sin(theta)  # right direction
-    z = np.cos(phi_rotated) * np.sin(theta)  # up direction
-
-    # Skip points behind the hemisphere
-    if x <= 0:
-        return None, None
-
-    # Gnomonic projection: project onto plane at x=1
-    u = y / x  # horizontal on projection plane
-    v = z / x  # vertical on projection plane
-
-    # Map projection plane to screen coordinates (4:3 to 16:9 stretch, with doubled FOV)
-    base_aspect = 4.0/3.0
-    fov_scale = 2.0  # Must match the FOV scaling above
-    screen_x = int((u / (base_aspect * SCALE_X * fov_scale) + 1.0) * W / 2.0)
-    screen_y = int((1.0 - v / (SCALE_Y * fov_scale)) * H / 2.0)  # flip y for screen coordinates
-
-    # Check bounds
-    if 0 <= screen_x < W and 0 <= screen_y < H:
-        return screen_x, screen_y
-    return None, None
-
-def draw_latitude_line(surface, lat_deg, color, rotation_offset=0, num_points=72):
-    """Draw a line of constant latitude using bulk drawing"""
-    points = []
-    theta = np.radians(90 - lat_deg)  # convert latitude to polar angle
-
-    for i in range(num_points + 1):
-        phi = 2 * np.pi * i / num_points - np.pi  # azimuth from -π to π
-        x, y = sphere_to_screen(theta, phi, rotation_offset)
-        if x is not None and y is not None:
-            points.append((x, y))
-
-    # Draw entire polyline in ONE pygame call
-    if len(points) > 1:
-        pygame.draw.lines(surface, color, False, points, 1)
-# Debug removed
-
-def draw_longitude_line(surface, lon_deg, color, rotation_offset=0, num_points=36):
-    """Draw a line of constant longitude using bulk drawing"""
-    points = []
-    phi = np.radians(lon_deg)
-
-    for i in range(num_points + 1):
-        lat_deg = 90 - 180 * i / num_points  # latitude from 90 to -90
-        theta = np.radians(90 - lat_deg)     # polar angle
-        x, y = sphere_to_screen(theta, phi, rotation_offset)
-        if x is not None and y is not None:
-            points.append((x, y))
-
-    # Draw entire polyline in ONE pygame call
-    if len(points) > 1:
-        pygame.draw.lines(surface, color, False, points, 1)
+    # Cached cartesian samples (pole toward viewer), rotated with one sin/cos of the offset
+    x, y, z = line_template('longitude_polar', lon_deg, num_points)
+    x, y = rotate_about_pole(x, y, rotation_offset)
+
+    # Project with the pole toward the viewer (z forward)
+    _draw_lines_1280(surface, [color], z, x, y, np.array([0, len(z)]))
+
+def draw_grid_polar_1280(surface, azimuths, longitudes, colors, rotation_offset=0,
+                         ring_points=200, longitude_points=144):
+    """Draw azimuth rings and longitude lines scaled for 1280x720 display with one batched projection
+
+    colors holds one color per line: all azimuth rings first, then all longitudes
+    """
+    keys = (tuple(('azimuth_polar', azimuth_deg, ring_points) for azimuth_deg in azimuths) +
+            tuple(('longitude_polar', lon_deg, longitude_points) for lon_deg in longitudes))
+
+    if keys not in _grid_cache:
+        # Keep only samples on the visible hemisphere (z > 0). Rotation about the pole leaves z
+        # unchanged, so this holds for every frame: it drops the far half of each meridian.
+        templates = []
+        for key in keys:
+            x, y, z = line_template(*key)
+            visible = z > 0
+            templates.append((x[visible], y[visible], z[visible]))
+
+        # Concatenate every line's visible samples once, remembering where each line starts
+        x, y, z = (np.concatenate(parts) for parts in zip(*templates))
+        bounds = np.concatenate(([0], np.cumsum([len(template[0]) for template in templates])))
+        _grid_cache[keys] = (x, y, z, bounds)
+    x, y, z, bounds = _grid_cache[keys]
+
+    # Rotate every sample with one sin/cos of the offset, then project with the pole toward the viewer
+    x, y = rotate_about_pole(x, y, rotation_offset)
+    _draw_lines_1280(surface, colors, z, x, y, bounds)
 
 def main():
     # Initialize pygame
@@ -187,9 +171,24 @@ def main():
     rotation_speed = 0.2  # radians per second (slower rotation)
     start_time = pygame.time.get_ticks()
 
+    # Azimuth rings (great-circle distances from pole) and longitude lines (meridians, every 15 degrees)
+    calibration_azimuths = [15, 30, 45, 60, 75]  # Don't draw 90° (edge)
+    longitudes = list(range(-180, 180, 15))
+    colors = ([RED if azimuth == 45 else GRAY for azimuth in calibration_azimuths] +  # Highlight 45° ring
+              [GREEN if lon == 0 else GRAY for lon in longitudes])  # Prime meridian in green
+    center_x, center_y = W // 2, H // 2
+
+    # Loop-invariant lookups bound once
+    get_ticks = pygame.time.get_ticks
+    get_events = pygame.event.get
+    fill = screen.fill
+    draw_line = pygame.draw.line
+    flip = pygame.display.flip
+    tick = clock.tick
+
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in get_events():
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -197,31 +196,23 @@ def main():
                     running = False
 
         # Calculate rotation based on elapsed time
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         elapsed_seconds = (current_time - start_time) / 1000.0
         rotation_offset = elapsed_seconds * rotation_speed
 
         # Clear screen
-        screen.fill(BLACK)
-
-        # Draw azimuth rings (great-circle distances from pole) using shared projection
-        calibration_azimuths = [15, 30, 45, 60, 75]  # Don't draw 90° (edge)
-        for azimuth in calibration_azimuths:
-            color = RED if azimuth == 45 else GRAY  # Highlight 45° ring
-            draw_azimuth_ring_polar_1280(screen, azimuth, color, rotation_offset, num_points=200)
+        fill(BLACK)
 
-        # Draw longitude lines (meridians) - every 15 degrees
-        for lon in range(-180, 180, 15):
-            color = GREEN if lon == 0 else GRAY  # Prime meridian in green
-            draw_longitude_line_polar_1280(screen, lon, color, rotation_offset, num_points=144)
+        # Draw azimuth rings and longitude lines with one batched projection
+        draw_grid_polar_1280(screen, calibration_azimuths, longitudes, colors, rotation_offset,
+                             ring_points=200, longitude_points=144)
 
         # Draw center crosshair
-        center_x, center_y = W // 2, H // 2
-        pygame.draw.line(screen, WHITE, (center_x - 20, center_y), (center_x + 20, center_y), 2)
-        pygame.draw.line(screen, WHITE, (center_x, center_y - 20), (center_x, center_y + 20), 2)
+        draw_line(screen, WHITE, (center_x - 20, center_y), (center_x + 20, center_y), 2)
+        draw_line(screen, WHITE, (center_x, center_y - 20), (center_x, center_y + 20), 2)
 
-        pygame.display.flip()
-        clock.tick(30)
+        flip()
+        tick(30)
 
     pygame.quit()
 